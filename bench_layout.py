@@ -0,0 +1,106 @@
+"""
+program: bench_layout.py
+
+purpose: Time layout computations for large numbers of images.
+
+comments: Run from the project directory: python bench_layout.py [n]
+          Image sizes are random, scaled to fit the viewport.
+
+author: Russell Folks
+
+history:
+-------
+10-18-2026  creation: grid_layout.grid_positions against a per-image loop
+            of render_core.get_1_posn.
+10-18-2026  Time grid_layout.justified_rows and masonry, and report the
+            fill ratio of each layout.
+10-18-2026  Time sorting and filtering an image_catalog.ImageCatalog
+            against a list of ImageObject.
+10-18-2026  Import the modules from the image_display_rf package.
+"""
+import sys
+import time
+
+import numpy as np
+
+from image_display_rf import grid_layout
+from image_display_rf import image_catalog
+from image_display_rf import render_core
+
+
+def best_of(fn: callable, repeat: int = 5) -> float:
+    """Return the shortest run time of fn, in milliseconds."""
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+
+    return min(times) * 1000
+
+
+def per_image_loop(vp: dict, wd: list, ht: list, cols: int) -> list:
+    """Position images one at a time, as the 2x2 code did."""
+    positions = []
+    for i in range(len(wd)):
+        posn = render_core.get_1_posn(vp, wd[i], ht[i], ('center', 'center'))
+        posn.x += (i % cols) * (vp['w'] + vp['gutter'])
+        posn.y += (i // cols) * (vp['h'] + vp['gutter'])
+        positions.append(posn)
+
+    return positions
+
+
+def main() -> None:
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000
+    cols = 100
+    vp = {'w': 200, 'h': 150, 'gutter': 10}
+
+    rng = np.random.default_rng(0)
+    wd = rng.integers(50, vp['w'] + 1, n)
+    ht = rng.integers(50, vp['h'] + 1, n)
+    wd_list, ht_list = wd.tolist(), ht.tolist()
+
+    print(f'{n} images, {cols} columns')
+    for arrange in (('center', 'center'), ('cc', 'cc')):
+        ms = best_of(lambda: grid_layout.grid_positions(vp, wd, ht, arrange, cols))
+        print(f'  grid_positions {arrange}: {ms:8.2f} ms')
+
+    ms = best_of(lambda: render_core.get_positions(vp, wd_list, ht_list, ('center', 'center'), cols))
+    print(f'  get_positions (Posn list):   {ms:8.2f} ms')
+
+    ms = best_of(lambda: per_image_loop(vp, wd_list, ht_list, cols))
+    print(f'  get_1_posn loop:             {ms:8.2f} ms')
+
+    rows = -(-n // cols)
+    width = grid_layout.canvas_size(vp, rows, cols)['w']
+    aspects = wd / ht
+    print('fill ratio:')
+    print(f'  grid:           {grid_layout.grid_fill(vp, wd, ht, rows, cols):.3f}')
+
+    ms = best_of(lambda: grid_layout.justified_rows(aspects, width, vp['h'], vp['gutter']))
+    layout = grid_layout.justified_rows(aspects, width, vp['h'], vp['gutter'])
+    print(f"  justified_rows: {layout['fill']:.3f}   {ms:8.2f} ms")
+
+    ms = best_of(lambda: grid_layout.masonry(aspects, cols, vp['w'], vp['gutter']))
+    layout = grid_layout.masonry(aspects, cols, vp['w'], vp['gutter'])
+    print(f"  masonry:        {layout['fill']:.3f}   {ms:8.2f} ms")
+
+    paths = [f'image_{i}.png' for i in range(n)]
+    catalog = image_catalog.ImageCatalog(paths, wd, ht)
+    objects = [render_core.ImageObject(p, w, h) for p, w, h in zip(paths, wd_list, ht_list)]
+    print('metadata:')
+    ms = best_of(lambda: catalog.ids_by('width'))
+    print(f'  catalog sort by width:       {ms:8.2f} ms')
+    ms = best_of(lambda: sorted(objects, key=lambda x: x.width))
+    print(f'  ImageObject sort by width:   {ms:8.2f} ms')
+    ms = best_of(lambda: catalog.where(catalog.aspects > 1))
+    print(f'  catalog filter landscape:    {ms:8.2f} ms')
+    ms = best_of(lambda: catalog.take(catalog.where(catalog.aspects > 1)))
+    print(f'  ... and take() a subset:     {ms:8.2f} ms')
+    ms = best_of(lambda: [obj for obj in objects if obj.width > obj.height])
+    print(f'  ImageObject filter:          {ms:8.2f} ms')
+
+
+if __name__ == "__main__":
+    main()
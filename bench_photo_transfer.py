@@ -0,0 +1,105 @@
+"""
+program: bench_photo_transfer.py
+
+purpose: Time the transfer of PIL frames to Tk photo images.
+
+comments: Run from the project directory: python bench_photo_transfer.py
+          For several frame sizes and source modes, times per frame:
+            new      - ImageTk.PhotoImage(frame), the path resize_images used;
+            paste    - ImageTk.PhotoImage.paste into a photo of that size;
+            put      - photo_transfer.put_image into one tk.PhotoImage, of
+                       the frame converted to RGB beforehand, as frames
+                       scaled from a display_source are. Includes building
+                       the PPM data.
+          The PIL side of each path is also timed alone: converting a frame
+          to RGB, and building its PPM data. These need no display, and are
+          the only times reported when Tk cannot open one.
+
+author: Russell Folks
+
+history:
+-------
+10-18-2026  creation.
+10-18-2026  Import photo_transfer from the image_display_rf package.
+"""
+import time
+import tkinter as tk
+
+from PIL import Image
+
+from image_display_rf import photo_transfer
+
+SIZES = ((320, 240), (800, 600), (1600, 1200), (2560, 1440))
+MODES = ('RGB', 'RGBA', 'P')
+
+
+def best_of(fn: callable, repeat: int = 7) -> float:
+    """Return the shortest run time of fn, in milliseconds."""
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+
+    return min(times) * 1000
+
+
+def make_frame(size: tuple, mode: str) -> Image.Image:
+    """A gradient test frame in the given mode."""
+    red = Image.linear_gradient('L').resize(size)
+    green = red.transpose(Image.Transpose.ROTATE_90).resize(size)
+    blue = Image.new('L', size, 128)
+    im = Image.merge('RGB', (red, green, blue))
+    if mode == 'RGBA':
+        im.putalpha(red)
+    elif mode == 'P':
+        im = im.convert('P', palette=Image.Palette.ADAPTIVE)
+
+    return im
+
+
+def open_root() -> object:
+    try:
+        root = tk.Tk()
+    except tk.TclError as e:
+        print(f'no display ({e}); timing the PIL side only.\n')
+        return None
+    root.withdraw()
+
+    return root
+
+
+def main() -> None:
+    root = open_root()
+    if root is not None:
+        from PIL import ImageTk
+
+    header = f"{'size':>10s} {'mode':>5s} {'to RGB':>8s} {'PPM data':>9s}"
+    if root is not None:
+        header += f" {'new':>8s} {'paste':>8s} {'put':>8s}"
+    print(header + '   (ms per frame)')
+
+    for size in SIZES:
+        for mode in MODES:
+            frame = make_frame(size, mode)
+            display = photo_transfer.to_display(frame)
+
+            to_rgb = best_of(lambda: photo_transfer.to_display(frame))
+            data = best_of(lambda: photo_transfer.ppm_data(display))
+            line = f'{size[0]:>5d}x{size[1]:<4d} {mode:>5s} {to_rgb:8.2f} {data:9.2f}'
+
+            if root is not None:
+                new = best_of(lambda: ImageTk.PhotoImage(frame).width())
+                tk_photo = ImageTk.PhotoImage(frame)
+                paste = best_of(lambda: tk_photo.paste(frame))
+                photo = photo_transfer.new_photo(display, root)
+                put = best_of(lambda: photo_transfer.put_image(photo, display))
+                line += f' {new:8.2f} {paste:8.2f} {put:8.2f}'
+            print(line)
+
+    if root is not None:
+        root.destroy()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+"""
+program: bench_startup.py
+
+purpose: Measure import cost of each module, and time to first window.
+
+comments: Run from the project directory: python bench_startup.py
+          Each measurement runs in a fresh interpreter. Import cost is the
+          total of the 'self' column of python -X importtime, so it
+          includes every module the import pulls in. Time to first window
+          is measured from the start of the interpreter's script to the end
+          of the first update() of the root window, with mainloop replaced
+          so the program exits at once. It needs a display, and the sibling
+          styles_ttk module.
+
+author: Russell Folks
+
+history:
+-------
+10-18-2026  creation.
+10-18-2026  Measure the modules of the image_display_rf package. The
+            interpreters run in the project directory, wherever this is
+            run from.
+"""
+import os
+import subprocess
+import sys
+import time
+
+PACKAGE = 'image_display_rf'
+PROJECT_DIR = os.path.dirname(os.path.abspath(__file__))
+
+MODULES = ('grid_layout', 'render_core', 'image_loader', 'canvas_ui',
+           'contact_sheet', 'image_canvas_static', 'image_canvas_dyn',
+           'image_canvas_both', 'image_canvas_gallery')
+
+PROGRAMS = ('image_canvas_static', 'image_canvas_dyn',
+            'image_canvas_both', 'image_canvas_gallery')
+
+# Replace mainloop with one update, and report the time at that point.
+FIRST_WINDOW = '''
+import time
+start = time.perf_counter()
+import tkinter
+
+def first_window(self, n=0):
+    self.update()
+    print(f'first window: {{(time.perf_counter() - start) * 1000:.1f}}')
+    self.destroy()
+
+tkinter.Misc.mainloop = first_window
+import importlib
+importlib.import_module('{package}.{module}').main()
+'''
+
+
+def import_ms(module: str) -> float:
+    """Total import time of module, in milliseconds, from -X importtime."""
+    proc = subprocess.run([sys.executable, '-X', 'importtime', '-c', f'import {PACKAGE}.{module}'],
+                          capture_output=True, text=True, cwd=PROJECT_DIR)
+    if proc.returncode != 0:
+        raise RuntimeError(proc.stderr.strip().splitlines()[-1])
+
+    total = 0
+    for line in proc.stderr.splitlines():
+        if line.startswith('import time:') and '|' in line:
+            field = line.split(':', 1)[1].split('|')[0].strip()
+            if field.isdigit():
+                total += int(field)
+
+    return total / 1000
+
+
+def first_window_ms(module: str) -> float:
+    """Time from script start to the first drawn window, in milliseconds."""
+    proc = subprocess.run([sys.executable, '-c', FIRST_WINDOW.format(package=PACKAGE, module=module)],
+                          capture_output=True, text=True, timeout=60, cwd=PROJECT_DIR)
+    for line in proc.stdout.splitlines():
+        if line.startswith('first window:'):
+            return float(line.split(':')[1])
+
+    raise RuntimeError(proc.stderr.strip().splitlines()[-1])
+
+
+def main() -> None:
+    print('import time (-X importtime total):')
+    for module in MODULES:
+        start = time.perf_counter()
+        try:
+            ms = import_ms(module)
+        except RuntimeError as e:
+            print(f'  {module:22s} failed: {e}')
+            continue
+        wall = (time.perf_counter() - start) * 1000
+        print(f'  {module:22s} {ms:8.1f} ms   (interpreter wall {wall:6.1f} ms)')
+
+    print('time to first window:')
+    for module in PROGRAMS:
+        try:
+            print(f'  {module:22s} {first_window_ms(module):8.1f} ms')
+        except (RuntimeError, subprocess.TimeoutExpired) as e:
+            print(f'  {module:22s} failed: {e}')
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""
+program: bench_watch.py
+
+purpose: Time directory scans with image_watch.DirectoryIndex.
+
+comments: Run from the project directory: python bench_watch.py [n]
+          Writes n small PNG files to a temporary directory, then times the
+          first scan (every header read), full and quick rescans of the
+          unchanged directory, and both kinds of rescan after one file is
+          added, one removed and one modified.
+
+author: Russell Folks
+
+history:
+-------
+10-18-2026  creation.
+10-18-2026  Import image_watch from the image_display_rf package.
+"""
+import io
+import os
+import sys
+import tempfile
+import time
+
+from PIL import Image
+
+from image_display_rf import image_watch
+
+
+def timed(fn: callable) -> tuple:
+    start = time.perf_counter()
+    result = fn()
+
+    return result, (time.perf_counter() - start) * 1000
+
+
+def main() -> None:
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 20_000
+
+    buf = io.BytesIO()
+    Image.new('RGB', (4, 3)).save(buf, 'PNG')
+    png = buf.getvalue()
+
+    with tempfile.TemporaryDirectory() as directory:
+        for i in range(n):
+            with open(os.path.join(directory, f'{i:06d}.png'), 'wb') as f:
+                f.write(png)
+
+        index = image_watch.DirectoryIndex(directory)
+        changes, ms = timed(index.scan)
+        print(f'{n} files')
+        print(f"  first scan:       {ms:8.1f} ms  ({len(changes['added'])} added)")
+
+        times = [timed(index.scan)[1] for _ in range(5)]
+        print(f'  unchanged, full:  {min(times):8.1f} ms')
+        times = [timed(lambda: index.scan(full=False))[1] for _ in range(5)]
+        print(f'  unchanged, quick: {min(times):8.3f} ms')
+
+        with open(os.path.join(directory, 'new.png'), 'wb') as f:
+            f.write(png)
+        os.remove(os.path.join(directory, '000000.png'))
+        Image.new('RGB', (8, 6)).save(os.path.join(directory, '000001.png'))
+        for full in (False, True):
+            changes, ms = timed(lambda: index.scan(full=full))
+            counts = {kind: len(paths) for kind, paths in changes.items()}
+            kind = 'full: ' if full else 'quick:'
+            print(f'  changed, {kind}   {ms:8.1f} ms  {counts}')
+        print(f'  headers read:     {index.headers_read}')
+
+
+if __name__ == "__main__":
+    main()
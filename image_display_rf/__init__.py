@@ -0,0 +1,18 @@
+"""
+package: image_display_rf
+
+purpose: Display images in tkinter Canvases: static grids, resizable images
+         and scrolling galleries, with the layout and rendering they share.
+
+comments: Importing the package imports nothing else, so a tool that needs
+          only grid_layout or render_core does not load Tk or the viewers.
+          The programs are image_canvas_static, image_canvas_dyn,
+          image_canvas_both, image_canvas_gallery and contact_sheet; each
+          runs in its main(), as a console script or with python -m.
+
+author: Russell Folks
+
+history:
+-------
+10-18-2026  creation: the modules move here from the project directory.
+"""
@@ -0,0 +1,406 @@
+"""
+module: animation.py
+
+purpose: Play animated GIF, APNG and WebP images in canvas image items.
+
+comments: An Animation decodes every frame of a file once, converted to RGB
+          or L over a background color (photo_transfer.to_display), with
+          each frame's duration. Decoded frames are kept no larger than the
+          largest box they will be shown in. Frames past max_bytes are kept
+          zlib-compressed, and expanded when they are scaled.
+          load_animation() does this in a worker thread, and returns None
+          for files with one frame or that cannot be decoded.
+          An AnimatedImage plays an Animation in one canvas image item. Its
+          frames are scaled to fit a box with the same ratio test as
+          canvas_ui.calc_resize_to_vp, in a LoadService if one is given.
+          If all scaled frames fit in max_bytes, they are scaled at once
+          while the old frames keep playing, and a PhotoImage for each is
+          made on first show, so after the first loop a frame costs one
+          itemconfigure. Otherwise the player keeps a window of as many
+          scaled frames as fit, from the current frame on, and the loader
+          scales frames ahead of play; they are written into one photo
+          with photo_transfer.put_image. A frame not ready when due is
+          skipped, and counted as late.
+          All players on a window share one AnimationClock: one after()
+          timer, set for the earliest frame due, so animations that are
+          due together are drawn in one tick. Players that are late skip
+          to the frame due now, rather than playing every frame slowly.
+
+author: Russell Folks
+
+history:
+-------
+10-18-2026  creation: Animation, load_animation, AnimationClock,
+            AnimatedImage.
+10-18-2026  Cap the memory of decoded frames as well as scaled ones; shrink
+            scaled frames to fit the cap instead of scaling on every tick.
+            Show frame 0 first. load_animation returns None for files that
+            fail part-way through.
+10-18-2026  Play at the size that fits the box, whatever the cap: decoded
+            frames past the cap are compressed, and scaled frames past it
+            are prepared ahead in a window, instead of either being shrunk.
+10-18-2026  Move into the image_display_rf package; import sibling
+            modules relatively.
+"""
+"""
+TODO: - Honor the loop count; animations now always repeat.
+"""
+import time
+import zlib
+
+from PIL import Image, ImageSequence
+
+from . import photo_transfer
+from . import render_core
+
+# frames of 10 ms or less are shown for 100 ms, as web browsers do.
+DEFAULT_DURATION_MS = 100
+
+# errors from a bad file, which leave it shown as a still image.
+DECODE_ERRORS = (OSError, EOFError, SyntaxError, ValueError, Image.DecompressionBombError)
+
+
+def fit_box(size: tuple, box: dict) -> tuple:
+    """(w, h) of an image of size scaled to fit a box, as calc_resize_to_vp does."""
+    newsize = render_core.compare_ratios(box['w'] / box['h'],
+                                         size[0] / size[1],
+                                         box['w'], box['h'])
+
+    return max(1, newsize['w']), max(1, newsize['h'])
+
+
+def frame_duration(info: dict) -> int:
+    """Duration of a frame in milliseconds, from its info dict."""
+    duration = info.get('duration') or 0
+
+    return DEFAULT_DURATION_MS if duration <= 10 else int(duration)
+
+
+class Animation:
+    """All frames of one animated image, decoded once, in display mode.
+
+    If max_box is given, frames are stored no larger than fits it. Once the
+    frames stored take max_bytes, the rest are stored zlib-compressed, as
+    (mode, data); frame() returns either kind as an image. size is the
+    native size; frame_size the size stored.
+    """
+    def __init__(self,
+                 path: str,
+                 background: tuple = (0, 0, 0),
+                 max_box: dict | None = None,
+                 max_bytes: int = 64 * 2**20):
+        self.path = path
+        self.frames = []
+        self.durations = []
+        self.bands = 1
+        self.nbytes_stored = 0
+        with Image.open(path) as im:
+            self.size = im.size
+            stored = fit_box(im.size, max_box) if max_box else im.size
+            self.frame_size = (min(stored[0], im.width), min(stored[1], im.height))
+
+            for frame in ImageSequence.Iterator(im):
+                self.durations.append(frame_duration(frame.info))
+                converted = photo_transfer.to_display(frame, background)
+                if converted.size != self.frame_size:
+                    converted = converted.resize(self.frame_size, Image.Resampling.LANCZOS)
+                elif converted is frame:
+                    # the iterator reuses one image for every frame.
+                    converted = frame.copy()
+                self.bands = max(self.bands, len(converted.getbands()))
+                self._store(converted, max_bytes)
+
+        self.total_ms = sum(self.durations)
+
+    def __len__(self) -> int:
+        return len(self.frames)
+
+    def _store(self, frame: Image.Image, max_bytes: int) -> None:
+        data = frame.tobytes()
+        if self.nbytes_stored + len(data) > max_bytes:
+            stored = (frame.mode, zlib.compress(data, 1))
+            self.nbytes_stored += len(stored[1])
+        else:
+            stored = frame
+            self.nbytes_stored += len(data)
+        self.frames.append(stored)
+
+    def frame(self, index: int) -> Image.Image:
+        """Frame index as an image, expanded if it is stored compressed."""
+        stored = self.frames[index]
+        if isinstance(stored, tuple):
+            mode, data = stored
+            return Image.frombytes(mode, self.frame_size, zlib.decompress(data))
+
+        return stored
+
+    def fit(self, box: dict) -> tuple:
+        """(w, h) of the frames scaled to fit a box, as calc_resize_to_vp does."""
+        return fit_box(self.size, box)
+
+    def nbytes(self, w: int, h: int) -> int:
+        """Bytes to keep all frames at w, h: PIL images plus Tk's 4 bytes per pixel."""
+        return len(self.frames) * w * h * (self.bands + 4)
+
+    def scaled(self,
+               w: int,
+               h: int,
+               resample: int = Image.Resampling.LANCZOS) -> list:
+        """All frames scaled to w, h. Does not touch Tk."""
+        return self.scaled_frames(range(len(self.frames)), w, h, resample)
+
+    def scaled_frames(self,
+                      indices: list,
+                      w: int,
+                      h: int,
+                      resample: int = Image.Resampling.LANCZOS) -> list:
+        """The frames in indices scaled to w, h. Does not touch Tk."""
+        return [self.frame(i).resize((w, h), resample) for i in indices]
+
+
+def load_animation(path: str,
+                   background: tuple = (0, 0, 0),
+                   max_box: dict | None = None,
+                   max_bytes: int = 64 * 2**20) -> Animation | None:
+    """Decode an animated image; see Animation.
+
+    Returns None if the file has one frame, or if any frame cannot be
+    decoded.
+    """
+    try:
+        with Image.open(path) as im:
+            if getattr(im, 'n_frames', 1) < 2:
+                return None
+        return Animation(path, background, max_box, max_bytes)
+    except DECODE_ERRORS:
+        return None
+
+
+class AnimationClock:
+    """One after() timer driving every AnimatedImage on a widget's window."""
+    def __init__(self, widget: object):
+        self.widget = widget
+        self.players = []
+        self.ticks = 0
+        self._job = None
+
+    def add(self, player: object) -> None:
+        if player not in self.players:
+            self.players.append(player)
+        self.reschedule()
+
+    def remove(self, player: object) -> None:
+        if player in self.players:
+            self.players.remove(player)
+        self.reschedule()
+
+    def reschedule(self) -> None:
+        """Set the timer for the earliest frame due."""
+        if self._job is not None:
+            self.widget.after_cancel(self._job)
+            self._job = None
+        if not self.players:
+            return
+
+        due = min(player.due for player in self.players)
+        delay_ms = max(1, round((due - time.monotonic()) * 1000))
+        self._job = self.widget.after(delay_ms, self._tick)
+
+    def _tick(self) -> None:
+        self._job = None
+        self.ticks += 1
+        now = time.monotonic()
+        for player in self.players:
+            if player.due <= now:
+                player.advance(now)
+        self.reschedule()
+
+
+class AnimatedImage:
+    """Play an Animation in a canvas image item, scaled to fit a box.
+
+    Nothing is drawn until frame 0 at the first size is ready; until then
+    the item keeps whatever image it has, and start() waits for it.
+    loader is an image_loader.LoadService for scaling, or None to scale
+    here. ahead is the most frames scaled in one job when frames are
+    prepared as they are played.
+    """
+    def __init__(self,
+                 canv: object,
+                 item: int,
+                 animation: Animation,
+                 clock: AnimationClock,
+                 loader: object = None,
+                 max_bytes: int = 32 * 2**20,
+                 ahead: int = 4):
+        self.canv = canv
+        self.item = item
+        self.animation = animation
+        self.clock = clock
+        self.loader = loader
+        self.max_bytes = max_bytes
+        self.ahead = ahead
+
+        self.size = None
+        self.frames = None       # all scaled frames, or None
+        self.photos = []         # PhotoImage per scaled frame, made on first show
+        self.window = 0          # frames kept when prepared during play, or 0
+        self.cache = {}          # index -> scaled frame, within the window
+        self.photo = None        # the one photo written during play
+        self.playing = False
+        self.index = 0
+        self.due = time.monotonic()
+        self._pending = False
+
+        self.shown = 0
+        self.skipped = 0
+        self.late = 0
+
+    def fit_to(self, box: dict) -> None:
+        """Scale the frames to fit a box, such as a viewport or the canvas."""
+        self.resize(*self.animation.fit(box))
+
+    def resize(self, w: int, h: int) -> None:
+        """Scale the frames to w, h.
+
+        If all frames at w, h fit in max_bytes, old frames play until the
+        new ones are ready. Otherwise frames are prepared during play, in
+        a window of as many as fit.
+        """
+        if (w, h) == self.size:
+            return
+        self.size = (w, h)
+        if self.loader is not None:
+            self.loader.cancel(self)
+        self._pending = False
+
+        if self.animation.nbytes(w, h) <= self.max_bytes:
+            self.window = 0
+            self.cache = {}
+            if self.loader is not None:
+                self.loader.submit(self, self.animation.scaled, w, h,
+                                   on_done=lambda frames, size=(w, h): self._use_frames(size, frames))
+            else:
+                self._use_frames((w, h), self.animation.scaled(w, h))
+        else:
+            self.window = max(2, self.max_bytes // (w * h * self.animation.bands))
+            self.frames = None
+            self.photos = []
+            self.cache = {}
+            self.photo = None
+            self._prepare()
+
+    def start(self) -> None:
+        """Play from frame 0, now if it is ready, else when it is."""
+        self.playing = True
+        if self not in self.clock.players:
+            self.index = 0
+            self._prepare()
+        self._begin_if_ready()
+
+    def stop(self) -> None:
+        self.playing = False
+        self.clock.remove(self)
+        if self.loader is not None:
+            self.loader.cancel(self)
+        self._pending = False
+
+    def advance(self, now: float) -> None:
+        """Show the frame due at now, skipping frames that are late."""
+        durations = self.animation.durations
+        if now - self.due > self.animation.total_ms / 1000:
+            # more than a loop behind, e.g. the window was busy: restart the clock.
+            self.due = now
+
+        steps = 0
+        while self.due <= now:
+            self.index = (self.index + 1) % len(durations)
+            self.due += durations[self.index] / 1000
+            steps += 1
+        self.skipped += steps - 1
+        self._show(self.index)
+        self._prepare()
+
+    def _ready(self, index: int) -> bool:
+        return self.frames is not None or index in self.cache
+
+    def _begin_if_ready(self) -> None:
+        """Show frame 0 for its full duration, then let the clock take over."""
+        if not self.playing or self in self.clock.players or not self._ready(0):
+            return
+        self.index = 0
+        self._show(0)
+        self.due = time.monotonic() + self.animation.durations[0] / 1000
+        self.clock.add(self)
+        self._prepare()
+
+    def _use_frames(self, size: tuple, frames: list) -> None:
+        if size != self.size:
+            return
+        self.frames = frames
+        self.photos = [None] * len(frames)
+        self.photo = None
+        self._begin_if_ready()
+
+    def _window(self) -> list:
+        """Indices of the frames to keep: the current one and those after it."""
+        n = len(self.animation)
+        return [(self.index + k) % n for k in range(min(self.window, n))]
+
+    def _prepare(self) -> None:
+        """Scale the next frames of the window that are missing, if none are pending."""
+        if not self.window or self._pending:
+            return
+        window = self._window()
+        if self in self.clock.players:
+            # the current frame has been shown; a late copy is no use.
+            window = window[1:]
+        missing = [i for i in window if i not in self.cache][:self.ahead]
+        if not missing:
+            return
+
+        self._pending = True
+        size = self.size
+        if self.loader is not None:
+            self.loader.submit(self, self.animation.scaled_frames, missing, *size,
+                               on_done=lambda frames, size=size, indices=missing:
+                                   self._add_frames(size, indices, frames))
+        else:
+            self._add_frames(size, missing, self.animation.scaled_frames(missing, *size))
+
+    def _add_frames(self, size: tuple, indices: list, frames: list) -> None:
+        if size != self.size or not self.window:
+            return
+        self._pending = False
+        window = set(self._window())
+        self.cache = {i: f for i, f in self.cache.items() if i in window}
+        self.cache.update((i, f) for i, f in zip(indices, frames) if i in window)
+        self._begin_if_ready()
+        self._prepare()
+
+    def _show(self, index: int) -> None:
+        if self.frames is not None:
+            photo = self.photos[index]
+            if photo is None:
+                photo = photo_transfer.new_photo(self.frames[index], self.canv)
+                self.photos[index] = photo
+            self.canv.itemconfigure(self.item, image=photo)
+        elif index in self.cache:
+            frame = self.cache[index]
+            if self.photo is None:
+                self.photo = photo_transfer.new_photo(frame, self.canv)
+                self.canv.itemconfigure(self.item, image=self.photo)
+            else:
+                photo_transfer.put_image(self.photo, frame)
+        else:
+            self.late += 1
+            return
+        self.shown += 1
+
+    def stats(self) -> dict:
+        return {'shown': self.shown,
+                'skipped': self.skipped,
+                'late': self.late,
+                'size': self.size,
+                'cached': self.frames is not None,
+                'window': self.window}
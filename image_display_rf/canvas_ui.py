@@ -0,0 +1,358 @@
+"""
+module: canvas_ui.py
+
+purpose: Types and functions for a canvas intended to contain images.
+
+comments: To display images at their native size(s) when img dimensions
+          are smaller than both the viewport height and width, EITHER: a new 
+          routine should be written, to replace compare_ratios, OR:
+          init_image_size wouldn't be needed in the calling
+          module, and native sizes would be used directly. That approach is not
+          transparent to the caller.
+          Note: this hasn't been tested.
+
+author: Russell Folks
+
+history:
+-------
+03-04-2024  creation
+03-14-2024  Add a section for utility functions.
+07-28-2024  Update function docstrings.
+08-03-2024  Added comments section to module header.
+08-16-2024  Edit get_posn to handle 2 or 3 images.
+08-19-2024  Add alignment options: vertical center, horizontal right.
+08-24-2024  Add function handle_extra to calculate position for images if
+            there are more than two of them. Add type hinting for functions
+            that don't have it.
+09-07-2024  Add get_1_posn(), to determine a single image position.
+09-12-2024  Add get_positions() to determine up to four image positions.
+            Remove handle_extra().
+09-13-2024  Add type hinting to get_1_posn and get_positions.
+10-23-2024  Add function set_canv_centered, to move all images toward the
+            center of the canvas, allowing for the viewport gutter.
+10-26-2024  Update set_canv_centered() to handle less than 4 images.
+11-27-2024  Correct type-hinting for some functions.
+11-28-2024  Adjust whitespace, remove commented-out code.
+10-18-2026  Add class ResizeScheduler, to collapse bursts of <Configure>
+            events into one resize after a settle delay.
+10-18-2026  Add class DynamicImage, to hold one persistent image item and
+            PhotoImage per canvas. resize_images updates it in place, and
+            calc_resize no longer deletes canvas items.
+10-18-2026  Two-phase resize: resize_images draws a fast preview, and
+            DynamicImage replaces it with a high-quality render once the
+            size is stable. Add resample parameter to calc_resize.
+10-18-2026  Add scale_image(), which resizes from the image's shared
+            pyramid (image_cache.py). calc_resize and calc_resize_to_vp
+            use it.
+10-18-2026  scale_image() uses image_cache.render_cache, an LRU cache of
+            renders. calc_resize and calc_resize_to_vp return the cache
+            key. DynamicImage can cache PhotoImages of final renders.
+10-18-2026  Add open_to_box(), to decode an image file near the size
+            needed for a target box: Image.draft for JPEG, Image.reduce
+            for other formats.
+10-18-2026  get_positions and set_canv_centered use grid_layout.py, so any
+            number of images can be placed in a grid of viewports.
+10-18-2026  scale_image, calc_resize, calc_resize_to_vp and open_to_box
+            accept an image_source.RawImageSource as well as a PIL image.
+10-18-2026  Add class BatchPlacer, to move many canvas items in one Tcl
+            call, skipping items that are already in place.
+10-18-2026  Move the functions that do not use Tk (compare_ratios,
+            scale_image, open_to_box, Posn, get_positions, get_1_posn,
+            set_canv_centered, init_image_size) to render_core.py. They
+            are imported here, so callers are unchanged.
+10-18-2026  Import PIL.ImageTk when a PhotoImage is first made.
+10-18-2026  DynamicImage can make final renders in an
+            image_loader.LoadService; a render for a size that has since
+            changed is cancelled or discarded.
+10-18-2026  DynamicImage can write frames into one tk.PhotoImage with
+            photo_transfer.py, converting the source's mode only once.
+10-18-2026  Add DynamicImage.cancel_final, for callers that take over the
+            image item.
+10-18-2026  DynamicImage(transfer=True) accepts random-access sources,
+            whose frames are flattened over the canvas color as drawn.
+10-18-2026  With transfer, DynamicImage writes final renders into its one
+            photo too, instead of caching a PhotoImage per render.
+10-18-2026  Move into the image_display_rf package; import sibling
+            modules relatively.
+"""
+"""
+TODO: - Should get_posn() be modified to prevent images from overflowing 
+        the viewport? This should probably be done by the caller.
+"""
+from PIL import Image
+import tkinter as tk
+
+from . import image_cache
+from . import photo_transfer
+from .render_core import (compare_ratios, scale_image, open_to_box, Posn,
+                         get_positions, get_1_posn, set_canv_centered,
+                         init_image_size)
+
+# -------------
+# static canvas: canvas and contained objects are fixed size
+# -------------
+class BatchPlacer:
+    """Move canvas items with one call to the Tcl interpreter.
+
+    place() takes item ids or tags, and the target upper-left corner of
+    each, as for Canvas.moveto. Targets already at their last placed
+    position are skipped; the rest are moved by one Tcl script. Items moved
+    by other code are not seen, so record their positions with remember().
+    'calls', 'moved' and 'skipped' count the work done.
+    """
+    def __init__(self, canv: tk.Canvas):
+        self.canv = canv
+        self.calls = 0
+        self.moved = 0
+        self.skipped = 0
+        self._placed = {}      # item id or tag -> (x, y)
+
+    def remember(self,
+                 targets: list,
+                 xs: list,
+                 ys: list) -> None:
+        """Record where items are, without moving them."""
+        for target, x, y in zip(targets, xs, ys):
+            self._placed[target] = (float(x), float(y))
+
+    def place(self,
+              targets: list,
+              xs: list,
+              ys: list) -> int:
+        """Move each target to (x, y); return the number of items moved."""
+        commands = []
+        for target, x, y in zip(targets, xs, ys):
+            xy = (float(x), float(y))
+            if self._placed.get(target) == xy:
+                self.skipped += 1
+                continue
+            self._placed[target] = xy
+            commands.append(f'{self.canv._w} moveto {{{target}}} {xy[0]!r} {xy[1]!r}')
+
+        if commands:
+            self.canv.tk.eval('\n'.join(commands))
+            self.calls += 1
+            self.moved += len(commands)
+
+        return len(commands)
+
+    def place_positions(self,
+                        targets: list,
+                        positions: list) -> int:
+        """place() for a list of Posn, as returned by get_positions."""
+        return self.place(targets,
+                          [posn.x for posn in positions],
+                          [posn.y for posn in positions])
+
+
+# --------------
+# dynamic canvas: canvas and contained objects can be resized.
+# --------------
+class ResizeScheduler:
+    """Collapse bursts of <Configure> events into one resize.
+
+    Each event replaces any pending one. The callback runs with the latest
+    event only after no new event has arrived for settle_ms milliseconds,
+    and the event queue is idle. Superseded events are counted in 'dropped'.
+    """
+    def __init__(self,
+                 canv: tk.Canvas,
+                 callback: callable,
+                 settle_ms: int = 50):
+        self.canv = canv
+        self.callback = callback
+        self.settle_ms = settle_ms
+        self.dropped = 0
+        self.rendered = 0
+        self._event = None
+        self._pending = None
+
+    def schedule(self, ev: tk.Event) -> None:
+        """Record the latest event and (re)start the settle timer."""
+        if self._pending is not None:
+            self.canv.after_cancel(self._pending)
+            self.dropped += 1
+        self._event = ev
+        self._pending = self.canv.after(self.settle_ms, self._on_settle)
+
+    def _on_settle(self) -> None:
+        self._pending = self.canv.after_idle(self._render)
+
+    def _render(self) -> None:
+        ev = self._event
+        self._pending = None
+        self._event = None
+        self.rendered += 1
+        self.callback(ev)
+
+
+class DynamicImage:
+    """Source image, canvas image item and PhotoImage for one dynamic canvas.
+
+    The item is created once. Resizing updates it in place, so the number of
+    items on the canvas stays constant.
+    Resizing is two-phase: a preview made with preview_filter is drawn at
+    once, and a render made with final_filter replaces it when the size has
+    not changed for final_ms milliseconds. If preview_filter is None, only
+    the final render is made.
+    Previews are not cached. If cache_photos is True, the PhotoImage of each
+    final render is kept in image_cache.render_cache with its image.
+    If loader (an image_loader.LoadService) is given, final renders are made
+    in its worker threads, and only the PhotoImage is made here. A new
+    preview cancels the final render in progress.
+    If transfer is True, the source is converted once to RGB or L, over the
+    canvas color (photo_transfer.display_source), and every frame is
+    written into the same tk.PhotoImage with photo_transfer.put_image;
+    cache_photos is then ignored, and only the PIL renders are cached.
+    """
+    def __init__(self,
+                 canv: tk.Canvas,
+                 im: object,
+                 preview_filter: int | None = Image.Resampling.NEAREST,
+                 final_filter: int = Image.Resampling.LANCZOS,
+                 final_ms: int = 150,
+                 cache_photos: bool = False,
+                 loader: object = None,
+                 transfer: bool = False):
+        self.canv = canv
+        self.im = im
+        self.transfer = transfer
+        if transfer:
+            self.background = photo_transfer.widget_rgb(canv)
+            self.im = photo_transfer.display_source(im, self.background)
+        self.preview_filter = preview_filter
+        self.final_filter = final_filter
+        self.final_ms = final_ms
+        self.cache_photos = cache_photos
+        self.loader = loader
+        self.photo = None
+        self.item = canv.create_image(0, 0, anchor=tk.NW)
+        self._photo_cached = False
+        self._final_job = None
+
+    def show(self,
+             im_new: object,
+             key: tuple | None = None) -> None:
+        """Display a resized image, reusing the PhotoImage if size is unchanged.
+
+        If key is given and cache_photos is set, the PhotoImage for key is
+        taken from, or added to, the render cache. A cached PhotoImage is
+        never pasted over. With transfer, every image is written into the
+        one photo.
+        """
+        if key is not None and self.cache_photos and not self.transfer:
+            photo = image_cache.render_cache.get_photo(key)
+            if photo is None:
+                photo = self._new_photo(im_new)
+                image_cache.render_cache.put_photo(key, photo)
+            self._photo_cached = True
+            self.photo = photo
+            self.canv.itemconfigure(self.item, image=self.photo)
+            return
+
+        if self.photo is not None and not self._photo_cached and self.transfer:
+            photo_transfer.put_image(self.photo, im_new, self.background)
+        elif (self.photo is not None and not self._photo_cached
+                and (self.photo.width(), self.photo.height()) == im_new.size):
+            self.photo.paste(im_new)
+        else:
+            self._photo_cached = False
+            self.photo = self._new_photo(im_new)
+            self.canv.itemconfigure(self.item, image=self.photo)
+
+    def _new_photo(self, im_new: object) -> object:
+        if self.transfer:
+            return photo_transfer.new_photo(im_new, self.canv, self.background)
+
+        from PIL import ImageTk
+
+        return ImageTk.PhotoImage(im_new)
+
+    def schedule_final(self, ev: tk.Event) -> None:
+        """(Re)start the timer for the high-quality render."""
+        self.cancel_final()
+        self._final_job = self.canv.after(self.final_ms, self.render_final, ev)
+
+    def cancel_final(self) -> None:
+        """Drop a pending high-quality render, timed or in the loader."""
+        if self._final_job is not None:
+            self.canv.after_cancel(self._final_job)
+            self._final_job = None
+        if self.loader is not None:
+            self.loader.cancel(self.item)
+
+    def render_final(self, ev: tk.Event) -> None:
+        """Replace the preview with a render made with final_filter."""
+        self._final_job = None
+        if self.loader is None:
+            self._show_final(calc_resize(ev, self.im, self.final_filter))
+        else:
+            self.loader.submit(self.item, calc_resize, ev, self.im, self.final_filter,
+                               on_done=self._show_final)
+
+    def _show_final(self, params: dict) -> None:
+        self.show(params['im_resize_new'], params['key'])
+
+
+def resize_images(ev: tk.Event,
+                  dyn: DynamicImage) -> None:
+    """Update the canvas image of a DynamicImage to a calculated size.
+
+    A fast preview is drawn now, and the high-quality render is scheduled.
+    """
+    if dyn.preview_filter is None:
+        dyn.render_final(ev)
+        return
+
+    params1 = calc_resize(ev, dyn.im, dyn.preview_filter, cache=False)
+    dyn.show(params1['im_resize_new'])
+    dyn.schedule_final(ev)
+
+
+def calc_resize_to_vp(vp: dict,
+                      im: object,
+                      resample: int | None = None) -> dict:
+    """Calculate new size for an image to fit a viewport."""
+    canv_width = vp['w']
+    canv_height = vp['h']
+
+    canv_ratio = canv_width / canv_height
+    im_ratio = im.width / im.height
+    # print(f"ratios: canv, im, cw, ch: {canv_ratio}, {im_ratio}, {canv_width}, {canv_height}")
+
+    newsize = compare_ratios(canv_ratio, im_ratio, canv_width, canv_height)
+
+    params = {'im_resize_new': scale_image(im, newsize['w'], newsize['h'], resample),
+              'wid_int': int(canv_width),
+              'ht_int': int(canv_height),
+              'key': image_cache.render_key(im, newsize['w'], newsize['h'], resample)}
+    
+    return params
+
+
+def calc_resize(ev: tk.Event,
+                im: object,
+                resample: int | None = None,
+                cache: bool = True) -> dict:
+    """Calculate new size for a dynamically resizable canvas.
+
+    resample is a PIL filter; None uses the PIL default for Image.resize.
+    cache is passed to scale_image().
+    """
+    canv_width = ev.width
+    canv_height = ev.height
+
+    canv_ratio = canv_width / canv_height
+    im_ratio = im.width / im.height
+    # print(f"ratios: canv, im, cw, ch: {canv_ratio}, {im_ratio}, {canv_width}, {canv_height}")
+
+    newsize = compare_ratios(canv_ratio, im_ratio, canv_width, canv_height)
+
+    params = {'im_resize_new': scale_image(im, newsize['w'], newsize['h'], resample, cache),
+              'im_wd_new': newsize['w'],
+              'im_ht_new': newsize['h'],
+              'canv_wd': int(canv_width),
+              'canv_ht': int(canv_height),
+              'key': image_cache.render_key(im, newsize['w'], newsize['h'], resample)}
+    
+    return params
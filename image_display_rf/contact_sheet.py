@@ -0,0 +1,285 @@
+"""
+program: contact_sheet.py
+
+purpose: Render directories of images to contact sheets, without a display.
+
+comments: Run as a command, for example:
+              contact-sheet images/ -o sheets --cols 2 --rows 2
+          or python -m image_display_rf.contact_sheet with the same
+          arguments. Relative paths are taken from the working directory.
+          Sources are directories (not recursive), image files, or '-' to
+          read paths from stdin, one per line. Paths are streamed: they are
+          grouped into sheets of cols x rows viewports as they are found,
+          and never collected into one list.
+          Each sheet is rendered and written by a worker process with the
+          functions in render_core.py, so the layout matches the static
+          canvas. At most max_in_flight sheets are queued or rendering at
+          once, so memory stays flat however many images there are.
+          On a 2 x 2 sheet, 2 to 4 images are ordered with
+          render_core.order_by_size_new, as image_canvas_static.py does;
+          other sheets keep the order the paths were found in.
+          At the end, images per second and time spent in each stage are
+          reported. Stage times are summed over all workers.
+
+author: Russell Folks
+
+history:
+-------
+10-18-2026  creation.
+10-18-2026  Order each sheet through an image_catalog.ImageCatalog.
+10-18-2026  Skip and report files that fail to decode for any reason, and
+            paths repeated within a sheet.
+10-18-2026  Order by size only on 2 x 2 sheets, the layout
+            order_by_size_new is written for. A group whose files all fail
+            writes no sheet and is not counted.
+10-18-2026  Move into the image_display_rf package; run it as the
+            contact-sheet command or with python -m.
+"""
+"""
+TODO: -
+"""
+import argparse
+import os
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+from PIL import Image
+
+from . import grid_layout
+from . import image_catalog
+from . import render_core
+
+STAGES = ('decode', 'layout', 'compose', 'save')
+
+# errors from one bad file, which skip that file but not the run.
+DECODE_ERRORS = (OSError, SyntaxError, ValueError, Image.DecompressionBombError)
+
+
+def iter_paths(sources: list) -> object:
+    """Yield image paths from directories, files, and '-' (stdin)."""
+    Image.init()
+    extensions = set(Image.registered_extensions())
+
+    for source in sources:
+        if source == '-':
+            for line in sys.stdin:
+                if line.strip():
+                    yield line.strip()
+        elif os.path.isdir(source):
+            with os.scandir(source) as entries:
+                for entry in entries:
+                    ext = os.path.splitext(entry.name)[1].lower()
+                    if ext in extensions and entry.is_file():
+                        yield entry.path
+        else:
+            yield source
+
+
+def iter_groups(paths: object, size: int) -> object:
+    """Yield lists of up to size paths."""
+    group = []
+    for path in paths:
+        group.append(path)
+        if len(group) == size:
+            yield group
+            group = []
+    if group:
+        yield group
+
+
+def render_sheet(index: int,
+                 paths: list,
+                 options: dict) -> dict:
+    """Render one sheet and write it to disk. Runs in a worker process.
+
+    Files that cannot be decoded are skipped, and listed in 'failed' with
+    their errors; a path repeated in the sheet is placed once, and counted
+    in 'duplicates'. Returns those, the output path, the number of images
+    placed and skipped, and the time spent in each stage. If no file can be
+    decoded, no sheet is written and the path is None.
+    """
+    vp = options['vp']
+    times = dict.fromkeys(STAGES, 0.0)
+
+    start = time.perf_counter()
+    scaled = {}
+    failed = []
+    duplicates = 0
+    for path in paths:
+        if path in scaled:
+            duplicates += 1
+            continue
+        try:
+            scaled[path] = render_core.open_to_box(path, vp, options['resample'], cache=False)
+        except DECODE_ERRORS as e:
+            failed.append((path, f'{type(e).__name__}: {e}'))
+    times['decode'] = time.perf_counter() - start
+    if not scaled:
+        return {'path': None,
+                'images': 0,
+                'skipped': len(failed),
+                'failed': failed,
+                'duplicates': duplicates,
+                'times': times}
+
+    start = time.perf_counter()
+    catalog = image_catalog.ImageCatalog(list(scaled),
+                                         [params['im_wd_new'] for params in scaled.values()],
+                                         [params['im_ht_new'] for params in scaled.values()])
+    order = catalog.paths
+    if (options['order'] != 'none' and options['cols'] == options['rows'] == 2
+            and 2 <= len(catalog) <= 4):
+        order = render_core.order_by_size_new(catalog, options['order'])
+    wd = [scaled[path]['im_wd_new'] for path in order]
+    ht = [scaled[path]['im_ht_new'] for path in order]
+    positions = render_core.get_positions(vp, wd, ht, options['arrange'],
+                                          options['cols'], options['rows'])
+    times['layout'] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    sheet = render_core.composite([scaled[path]['im_resize_new'] for path in order],
+                                  positions,
+                                  grid_layout.canvas_size(vp, options['rows'], options['cols']),
+                                  options['background'])
+    if options['borders']:
+        render_core.draw_vp_borders(sheet, vp, options['rows'], options['cols'])
+    times['compose'] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    out_path = os.path.join(options['out_dir'],
+                            f"{options['prefix']}_{index:04d}.{options['format']}")
+    sheet.save(out_path)
+    times['save'] = time.perf_counter() - start
+
+    return {'path': out_path,
+            'images': len(order),
+            'skipped': len(failed),
+            'failed': failed,
+            'duplicates': duplicates,
+            'times': times}
+
+
+def make_sheets(sources: list,
+                options: dict,
+                workers: int | None = None,
+                max_in_flight: int | None = None,
+                verbose: bool = True) -> dict:
+    """Render all sheets in a process pool, with bounded work in flight.
+
+    Returns totals: sheets, images, skipped, duplicates, the failed paths
+    with their errors, wall time, and stage times.
+    """
+    workers = workers or os.cpu_count() or 1
+    max_in_flight = max_in_flight or 2 * workers
+    per_sheet = options['cols'] * options['rows']
+    os.makedirs(options['out_dir'], exist_ok=True)
+
+    totals = {'sheets': 0, 'images': 0, 'skipped': 0, 'duplicates': 0,
+              'failed': [], 'times': dict.fromkeys(STAGES, 0.0)}
+
+    def collect(done: set) -> None:
+        for future in done:
+            result = future.result()
+            if result['path'] is not None:
+                totals['sheets'] += 1
+            totals['images'] += result['images']
+            totals['skipped'] += result['skipped']
+            totals['duplicates'] += result['duplicates']
+            totals['failed'].extend(result['failed'])
+            for stage, seconds in result['times'].items():
+                totals['times'][stage] += seconds
+            if verbose:
+                if result['path'] is None:
+                    print('no sheet written: no image could be decoded')
+                else:
+                    print(f"{result['path']}: {result['images']} images")
+                for path, error in result['failed']:
+                    print(f'  skipped {path}: {error}')
+
+    start = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending = set()
+        groups = iter_groups(iter_paths(sources), per_sheet)
+        for index, group in enumerate(groups):
+            if len(pending) >= max_in_flight:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                collect(done)
+            pending.add(pool.submit(render_sheet, index, group, options))
+
+        done, _ = wait(pending)
+        collect(done)
+    totals['wall'] = time.perf_counter() - start
+
+    return totals
+
+
+def report(totals: dict) -> None:
+    wall = totals['wall']
+    rate = totals['images'] / wall if wall else 0.0
+    print(f"{totals['sheets']} sheets, {totals['images']} images "
+          f"({totals['skipped']} skipped, {totals['duplicates']} duplicates) "
+          f"in {wall:.2f} s: {rate:.1f} images/s")
+    print('stage times, summed over workers:')
+    for stage, seconds in totals['times'].items():
+        per_sheet = seconds / totals['sheets'] * 1000 if totals['sheets'] else 0.0
+        print(f'  {stage:8s} {seconds:8.2f} s  {per_sheet:8.1f} ms/sheet')
+
+
+def parse_args(argv: list | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description='Render images to contact sheets.')
+    parser.add_argument('sources', nargs='+',
+                        help="directories, image files, or '-' for paths on stdin")
+    parser.add_argument('-o', '--out-dir', default='sheets')
+    parser.add_argument('--prefix', default='sheet')
+    parser.add_argument('--format', default='png', help='output file extension')
+    parser.add_argument('--cols', type=int, default=2)
+    parser.add_argument('--rows', type=int, default=2)
+    parser.add_argument('--vp-width', type=int, default=200)
+    parser.add_argument('--vp-height', type=int, default=150)
+    parser.add_argument('--gutter', type=int, default=10)
+    parser.add_argument('--horizontal', default='left',
+                        choices=['left', 'center', 'right'])
+    parser.add_argument('--vertical', default='top',
+                        choices=['top', 'center', 'bottom'])
+    parser.add_argument('--centered', action='store_true',
+                        help='pull images toward the center of the sheet')
+    parser.add_argument('--order', default='width',
+                        choices=['width', 'height', 'none'],
+                        help='dimension used to order 2 x 2 sheets of 2-4 images')
+    parser.add_argument('--borders', action='store_true',
+                        help='outline each viewport')
+    parser.add_argument('--background', default='green')
+    parser.add_argument('--workers', type=int, default=None)
+    parser.add_argument('--max-in-flight', type=int, default=None)
+    parser.add_argument('-q', '--quiet', action='store_true')
+
+    return parser.parse_args(argv)
+
+
+def main(argv: list | None = None) -> None:
+    args = parse_args(argv)
+    if args.centered:
+        arrange = ('cc', 'cc')
+    else:
+        arrange = (args.horizontal, args.vertical)
+
+    options = {'vp': {'w': args.vp_width, 'h': args.vp_height, 'gutter': args.gutter},
+               'cols': args.cols,
+               'rows': args.rows,
+               'arrange': arrange,
+               'order': args.order,
+               'borders': args.borders,
+               'background': args.background,
+               'resample': Image.Resampling.LANCZOS,
+               'out_dir': args.out_dir,
+               'prefix': args.prefix,
+               'format': args.format}
+
+    totals = make_sheets(args.sources, options, args.workers, args.max_in_flight,
+                         verbose=not args.quiet)
+    report(totals)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,447 @@
+"""
+module: gallery_canvas.py
+
+purpose: A scrollable gallery canvas that only materializes visible tiles.
+
+comments: Tiles are viewports in a grid with a fixed number of columns,
+          laid out with grid_layout.py. The canvas scroll region covers the
+          whole grid, but PhotoImages and canvas items exist only for tiles
+          in, or within margin_rows of, the visible region. Image items are
+          taken from a pool and recycled as tiles scroll out of view, so
+          memory use and the number of canvas items depend on the window
+          size, not on the number of images.
+          Based on the sketch in 'canvas class with scroll.txt'.
+          A TilePrefetcher watches the scroll position reported through
+          yscrollcommand, and decodes the rows about to scroll into view in
+          worker threads. It uses the gallery's own load_tile function, so
+          prefetched tiles are identical to tiles loaded on demand.
+          Tiles loaded on demand (not prefetched) are decoded in an
+          image_loader.LoadService, so scrolling to an unloaded region does
+          not block the event loop: the tiles appear as they are ready, and
+          loads for tiles scrolled out of view are cancelled.
+
+author: Russell Folks
+
+history:
+-------
+10-18-2026  creation: class GalleryCanvas.
+10-18-2026  Add class TilePrefetcher, driven by scroll direction and speed.
+10-18-2026  Import PIL.ImageTk when a tile is first shown.
+10-18-2026  Add GalleryCanvas.set_paths, to follow a changing directory
+            while keeping tiles that did not change, and
+            TilePrefetcher.reset.
+10-18-2026  Load tiles on demand in an image_loader.LoadService, off the
+            Tk thread, if load_workers is not 0.
+10-18-2026  TilePrefetcher workers survive tiles that fail to load; the
+            failures are counted in stats().
+10-18-2026  TilePrefetcher.reset starts a new epoch; results of loads that
+            began before it are dropped, so a tile never shows the image
+            that was at its index before the paths changed.
+10-18-2026  Count tiles that fail to load on demand in load_errors, instead
+            of raising on the Tk thread; the tile stays empty.
+10-18-2026  set_paths matches tiles by path, not index: a kept tile moves
+            to its new grid position, in one call with
+            canvas_ui.BatchPlacer, so a file added before the view does not
+            reload every visible tile.
+10-18-2026  Move into the image_display_rf package; import sibling
+            modules relatively.
+"""
+"""
+TODO: -
+"""
+import itertools
+import math
+import queue
+import threading
+import time
+import tkinter as tk
+from collections import OrderedDict
+from tkinter import ttk
+
+from . import canvas_ui
+from . import grid_layout
+from . import image_loader
+
+
+class TilePrefetcher:
+    """Load tiles ahead of the scroll direction in worker threads.
+
+    load(index) must be safe to call from any thread; it returns the result
+    later handed to the gallery. observe() is called with the yscrollcommand
+    fractions. From successive calls it estimates direction and speed in
+    rows per second, and queues the tiles of the rows ahead of the view:
+    base_rows, plus the rows covered in lookahead_s seconds at the current
+    speed, up to max_rows. Nearer rows have higher priority. When the
+    direction reverses, jobs still queued are cancelled. At most max_ready
+    finished tiles are kept, oldest dropped first. A tile whose load
+    raises is counted in 'errors' and left to be loaded on demand.
+    """
+    def __init__(self,
+                 load: callable,
+                 n_tiles: int,
+                 cols: int,
+                 workers: int = 2,
+                 base_rows: int = 1,
+                 max_rows: int = 6,
+                 lookahead_s: float = 0.5,
+                 max_ready: int = 64):
+        self.load = load
+        self.n_tiles = n_tiles
+        self.cols = cols
+        self.rows = -(-n_tiles // cols)
+        self.base_rows = base_rows
+        self.max_rows = max_rows
+        self.lookahead_s = lookahead_s
+        self.max_ready = max_ready
+
+        self.hits = 0
+        self.misses = 0
+        self.cancelled = 0
+        self.errors = 0
+
+        self._jobs = queue.PriorityQueue()
+        self._seq = itertools.count()
+        self._lock = threading.Lock()
+        self._generation = 0
+        self._epoch = 0                 # bumped by reset(), when paths change
+        self._queued = set()
+        self._ready = OrderedDict()     # tile index -> load() result
+        self._direction = 0
+        self._last = None               # (time, first fraction)
+
+        self._threads = [threading.Thread(target=self._work, daemon=True)
+                         for _ in range(workers)]
+        for t in self._threads:
+            t.start()
+
+    def observe(self, first: float, last: float) -> None:
+        """Update speed and direction from the view fractions, and queue jobs."""
+        now = time.monotonic()
+        first, last = float(first), float(last)
+        speed = 0.0
+        direction = self._direction
+        if self._last is not None:
+            dt = now - self._last[0]
+            d_rows = (first - self._last[1]) * self.rows
+            if d_rows:
+                direction = 1 if d_rows > 0 else -1
+                speed = abs(d_rows) / dt if dt > 0 else 0.0
+        self._last = (now, first)
+
+        if direction != self._direction:
+            self._direction = direction
+            self.cancel()
+        if direction == 0:
+            return
+
+        ahead = min(self.max_rows,
+                    self.base_rows + math.ceil(speed * self.lookahead_s))
+        first_row = int(first * self.rows)
+        last_row = min(self.rows - 1, math.ceil(last * self.rows))
+        if direction > 0:
+            rows = range(last_row + 1, min(self.rows, last_row + 1 + ahead))
+        else:
+            rows = range(first_row - 1, max(-1, first_row - 1 - ahead), -1)
+
+        for distance, row in enumerate(rows):
+            for index in range(row * self.cols, min(self.n_tiles, (row + 1) * self.cols)):
+                self._submit(index, distance)
+
+    def take(self, index: int) -> dict | None:
+        """Return and forget the prefetched result for a tile, or None."""
+        with self._lock:
+            result = self._ready.pop(index, None)
+            if result is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+
+        return result
+
+    def cancel(self) -> None:
+        """Drop all queued jobs; jobs already running still finish."""
+        with self._lock:
+            self._generation += 1
+            self.cancelled += len(self._queued)
+            self._queued.clear()
+
+    def reset(self, n_tiles: int) -> None:
+        """Forget all queued and finished work, for a new set of n_tiles tiles.
+
+        Loads already running finish, but their results are dropped.
+        """
+        self.cancel()
+        with self._lock:
+            self._epoch += 1
+            self._ready.clear()
+            self.n_tiles = n_tiles
+            self.rows = -(-n_tiles // self.cols)
+
+    def close(self) -> None:
+        """Stop the worker threads."""
+        self.cancel()
+        for _ in self._threads:
+            self._jobs.put((-1, next(self._seq), None, None))
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {'hits': self.hits,
+                    'misses': self.misses,
+                    'cancelled': self.cancelled,
+                    'errors': self.errors,
+                    'ready': len(self._ready)}
+
+    def _submit(self, index: int, priority: int) -> None:
+        with self._lock:
+            if index in self._queued or index in self._ready:
+                return
+            self._queued.add(index)
+            generation = self._generation
+        self._jobs.put((priority, next(self._seq), generation, index))
+
+    def _work(self) -> None:
+        while True:
+            _priority, _seq, generation, index = self._jobs.get()
+            if index is None:
+                return
+            with self._lock:
+                if generation != self._generation:
+                    continue
+                self._queued.discard(index)
+                epoch = self._epoch
+
+            try:
+                result = self.load(index)
+            except Exception:
+                with self._lock:
+                    self.errors += 1
+                continue
+
+            with self._lock:
+                if epoch != self._epoch:
+                    continue
+                self._ready[index] = result
+                while len(self._ready) > self.max_ready:
+                    self._ready.popitem(last=False)
+
+
+class GalleryCanvas(ttk.Frame):
+    """Frame with a vertically scrolling canvas of image tiles.
+
+    paths are image files, shown in order, fitted and centered in
+    viewports of size vp. visible_rows sets the initial canvas height.
+    If prefetch_workers is not 0, a TilePrefetcher loads the rows ahead of
+    the scroll direction. If load_workers is not 0, tiles that were not
+    prefetched are loaded in a LoadService; otherwise they are loaded here.
+    """
+    def __init__(self,
+                 parent: object,
+                 paths: list,
+                 vp: dict,
+                 cols: int = 4,
+                 visible_rows: int = 3,
+                 margin_rows: int = 1,
+                 disk_cache: object = None,
+                 prefetch_workers: int = 2,
+                 load_workers: int = 2,
+                 **canvas_options):
+        super().__init__(parent)
+        self.paths = paths
+        self.vp = vp
+        self.cols = cols
+        self.margin_rows = margin_rows
+        self.disk_cache = disk_cache
+
+        self.rows = grid_layout.grid_shape(len(paths), cols)[0]
+        full_size = grid_layout.canvas_size(vp, self.rows, cols)
+        view_size = grid_layout.canvas_size(vp, min(visible_rows, self.rows), cols)
+
+        self.scrollbary = ttk.Scrollbar(self, orient=tk.VERTICAL)
+        self.scrollbary.pack(side=tk.RIGHT, fill=tk.Y)
+
+        self.canvas = tk.Canvas(self,
+                                width=view_size['w'],
+                                height=view_size['h'],
+                                scrollregion=(0, 0, full_size['w'], full_size['h']),
+                                yscrollcommand=self._on_yscroll,
+                                yscrollincrement=(vp['h'] + vp['gutter']) // 4,
+                                highlightthickness=0,
+                                **canvas_options)
+        self.canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        self.scrollbary.config(command=self.canvas.yview)
+
+        self._items = {}       # tile index -> canvas item id
+        self._photos = {}      # tile index -> PhotoImage
+        self._sizes = {}       # tile index -> (w, h) of its image
+        self._placer = canvas_ui.BatchPlacer(self.canvas)
+        self._free_items = []
+        self._refresh_job = None
+        self.load_errors = 0
+
+        self.prefetcher = None
+        if prefetch_workers:
+            self.prefetcher = TilePrefetcher(self.load_tile, len(paths), cols,
+                                             workers=prefetch_workers)
+            self.bind('<Destroy>', lambda ev: self.prefetcher.close(), add='+')
+
+        self.loader = None
+        if load_workers:
+            self.loader = image_loader.LoadService(self, workers=load_workers)
+            self.bind('<Destroy>', lambda ev: self.loader.shutdown(), add='+')
+
+        self.canvas.bind('<Configure>', lambda ev: self.schedule_refresh())
+        for seq in ('<MouseWheel>', '<Button-4>', '<Button-5>'):
+            self.canvas.bind(seq, self._on_wheel)
+
+    @property
+    def item_count(self) -> int:
+        """Number of image items on the canvas, in use or pooled."""
+        return len(self._items) + len(self._free_items)
+
+    @property
+    def photo_count(self) -> int:
+        return len(self._photos)
+
+    def visible_range(self) -> range:
+        """Indices of the tiles in, or within margin_rows of, the view."""
+        row_ht = self.vp['h'] + self.vp['gutter']
+        top = self.canvas.canvasy(0)
+        bottom = top + self.canvas.winfo_height()
+
+        first_row = max(0, int(top // row_ht) - self.margin_rows)
+        last_row = min(self.rows - 1, int(bottom // row_ht) + self.margin_rows)
+
+        return range(first_row * self.cols,
+                     min(len(self.paths), (last_row + 1) * self.cols))
+
+    def schedule_refresh(self) -> None:
+        """Refresh the materialized tiles once the event queue is idle."""
+        if self._refresh_job is None:
+            self._refresh_job = self.after_idle(self.refresh)
+
+    def refresh(self) -> None:
+        """Release tiles that left the view, and materialize the new ones."""
+        self._refresh_job = None
+        wanted = self.visible_range()
+
+        for index in [i for i in self._items if i not in wanted]:
+            self._release(index)
+        if self.loader is not None:
+            for index in self.loader.pending_keys():
+                if index not in wanted:
+                    self.loader.cancel(index)
+
+        for index in wanted:
+            if index in self._items:
+                continue
+            result = self.prefetcher.take(index) if self.prefetcher else None
+            if result is not None:
+                self.show_tile(index, result)
+            elif self.loader is None:
+                self.show_tile(index, self.load_tile(index))
+            elif not self.loader.is_pending(index):
+                self.loader.submit(index, self.load_tile, index,
+                                   on_done=lambda result, index=index: self._on_loaded(index, result),
+                                   on_error=self._on_load_error)
+
+    def set_paths(self,
+                  paths: list,
+                  modified: object = ()) -> None:
+        """Show a new list of paths, reloading only tiles that changed.
+
+        A materialized tile is kept if its path is still in paths and is not
+        in modified, and is moved to the path's new index; the others are
+        released. Tiles in view that are not kept are loaded by the next
+        refresh. The scroll region follows the number of rows.
+        """
+        modified = set(modified)
+        new_index = {path: i for i, path in enumerate(paths)}
+        if self.loader is not None:
+            self.loader.cancel_all()
+
+        kept = {}
+        for index in list(self._items):
+            path = self.paths[index]
+            if path in modified or path not in new_index:
+                self._release(index)
+            else:
+                kept[new_index[path]] = (self._items.pop(index),
+                                         self._photos.pop(index),
+                                         self._sizes.pop(index))
+        for index, (item, photo, size) in kept.items():
+            self._items[index] = item
+            self._photos[index] = photo
+            self._sizes[index] = size
+
+        if kept:
+            indices = list(kept)
+            xs, ys = grid_layout.grid_positions(self.vp,
+                                                [self._sizes[i][0] for i in indices],
+                                                [self._sizes[i][1] for i in indices],
+                                                ('center', 'center'), self.cols,
+                                                index=indices)
+            self._placer.place([self._items[i] for i in indices], xs, ys)
+
+        if self.prefetcher is not None:
+            self.prefetcher.reset(len(paths))
+        self.paths = paths
+        self.rows = grid_layout.grid_shape(len(paths), self.cols)[0]
+        full_size = grid_layout.canvas_size(self.vp, self.rows, self.cols)
+        self.canvas.configure(scrollregion=(0, 0, full_size['w'], full_size['h']))
+        self.schedule_refresh()
+
+    def load_tile(self, index: int) -> dict:
+        """Decode and scale one tile; see image_loader.load_one().
+
+        This is the only tile loader, used both on demand and by the
+        prefetcher. It does not touch Tk, so it may run in any thread.
+        """
+        return image_loader.load_one(self.paths[index], self.vp, self.disk_cache)
+
+    def show_tile(self, index: int, result: dict) -> None:
+        """Place a loaded tile in its viewport, using a pooled item."""
+        from PIL import ImageTk
+
+        xs, ys = grid_layout.grid_positions(self.vp, [result['w']], [result['h']],
+                                            ('center', 'center'), self.cols,
+                                            index=[index])
+        photo = ImageTk.PhotoImage(result['im_resize_new'])
+
+        if self._free_items:
+            item = self._free_items.pop()
+            self.canvas.coords(item, xs[0], ys[0])
+            self.canvas.itemconfigure(item, image=photo, state='normal')
+        else:
+            item = self.canvas.create_image(xs[0], ys[0], anchor=tk.NW, image=photo)
+
+        self._items[index] = item
+        self._photos[index] = photo
+        self._sizes[index] = (result['w'], result['h'])
+        self._placer.remember([item], xs, ys)
+
+    def _on_loaded(self, index: int, result: dict) -> None:
+        if index not in self._items and index in self.visible_range():
+            self.show_tile(index, result)
+
+    def _on_load_error(self, exc: Exception) -> None:
+        self.load_errors += 1
+
+    def _release(self, index: int) -> None:
+        """Hide a tile's item and return it to the pool."""
+        item = self._items.pop(index)
+        self.canvas.itemconfigure(item, image='', state='hidden')
+        self._free_items.append(item)
+        self._photos.pop(index, None)
+        self._sizes.pop(index, None)
+
+    def _on_yscroll(self, first: str, last: str) -> None:
+        self.scrollbary.set(first, last)
+        if self.prefetcher is not None:
+            self.prefetcher.observe(first, last)
+        self.schedule_refresh()
+
+    def _on_wheel(self, ev: tk.Event) -> None:
+        if ev.num == 4 or ev.delta > 0:
+            self.canvas.yview_scroll(-1, 'units')
+        else:
+            self.canvas.yview_scroll(1, 'units')
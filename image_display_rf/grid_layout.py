@@ -0,0 +1,406 @@
+"""
+module: grid_layout.py
+
+purpose: Image positions for a grid of viewports, computed over arrays.
+
+comments: The canvas is divided into rows x cols viewports, separated by a
+          gutter. Images fill viewports in row order: left to right, then
+          top to bottom. All positions are computed at once with NumPy, so
+          a layout of many thousands of images costs about the same as one
+          of four.
+          Alignment within viewports is given as a (horizontal, vertical)
+          tuple, as in canvas_ui.get_positions. The special arrangement
+          ('cc', 'cc') pulls images toward the center of the whole grid:
+          columns left of center are right-aligned, columns right of center
+          are left-aligned, and a middle column is centered; likewise for
+          rows. For a 2x2 grid this is canvas_ui.set_canv_centered.
+          Packed layouts do not use viewports. justified_rows fills rows of
+          a fixed width, scaling each row to a common height near a target.
+          masonry puts each image in the shortest of a number of fixed-width
+          columns. Both return arrays x, y, w, h of every image, in input
+          order, and 'fill': the fraction of the layout's bounding area
+          covered by images. x and y can be passed directly to
+          canvas_ui.BatchPlacer.place.
+          A LayoutModel holds the positions of a grid layout between
+          changes. x depends only on an image's column, its width and the
+          horizontal alignment; y only on its row, its height and the
+          vertical alignment. Changes recompute only the affected axis or
+          image, and return just the positions that moved.
+          A LayoutModel can also hold a packed layout (packing='justified'
+          or 'masonry') in the width of its grid. Then it sets the display
+          size of every image as well as its position, and alignment does
+          not apply.
+
+author: Russell Folks
+
+history:
+-------
+10-18-2026  creation: grid_positions, vp_rects, canvas_size.
+10-18-2026  grid_positions takes an optional index array, to place a subset
+            of a larger grid (such as the visible tiles of a gallery).
+10-18-2026  Add justified_rows and masonry, layouts driven by image aspect
+            ratios rather than fixed viewports, and grid_fill, so layouts
+            can be compared by the fraction of canvas area they cover.
+10-18-2026  Add class LayoutModel, which keeps grid positions and updates
+            only those a change of alignment, viewport or image size
+            affects.
+10-18-2026  LayoutModel takes packing='justified' or 'masonry', so a canvas
+            can use the packed layouts in place of viewports.
+"""
+"""
+TODO: -
+"""
+import heapq
+
+import numpy as np
+
+# fraction of the free space in a viewport placed before the image
+H_ALIGN = {'left': 0.0, 'center': 0.5, 'right': 1.0}
+V_ALIGN = {'top': 0.0, 'center': 0.5, 'bottom': 1.0}
+
+
+def grid_shape(n: int,
+               cols: int = 2,
+               rows: int | None = None) -> tuple:
+    """Return (rows, cols) for n images; rows grows to hold them all."""
+    needed = max(1, -(-n // cols))
+
+    return (needed if rows is None else max(rows, needed)), cols
+
+
+def centered_fractions(count: int) -> np.ndarray:
+    """Alignment fractions that pull each of count cells toward the middle."""
+    idx = np.arange(count)
+    mid = (count - 1) / 2
+
+    return np.where(idx < mid, 1.0, np.where(idx > mid, 0.0, 0.5))
+
+
+def grid_positions(vp: dict,
+                   wd: object,
+                   ht: object,
+                   arrange: tuple = ('left', 'top'),
+                   cols: int = 2,
+                   rows: int | None = None,
+                   gutter: int | None = None,
+                   index: object = None) -> tuple:
+    """Return arrays (xs, ys) of the upper-left corner of every image.
+
+    wd and ht are sequences or arrays of display widths and heights.
+    rows is only needed for ('cc', 'cc'), where the grid center depends on
+    the number of rows; by default it is just enough to hold all images.
+    gutter defaults to vp['gutter'].
+    index gives the grid position of each image, for laying out part of a
+    larger grid; by default images occupy positions 0, 1, 2, ...
+    """
+    wd = np.asarray(wd, dtype=float)
+    ht = np.asarray(ht, dtype=float)
+    idx = np.arange(len(wd)) if index is None else np.asarray(index)
+    n = int(idx.max()) + 1 if len(idx) else 0
+    rows, cols = grid_shape(n, cols, rows)
+    if gutter is None:
+        gutter = vp['gutter']
+
+    col = idx % cols
+    row = idx // cols
+
+    if arrange == ('cc', 'cc'):
+        fx = centered_fractions(cols)[col]
+        fy = centered_fractions(rows)[row]
+    else:
+        fx = H_ALIGN[arrange[0]]
+        fy = V_ALIGN[arrange[1]]
+
+    xs = col * (vp['w'] + gutter) + fx * (vp['w'] - wd)
+    ys = row * (vp['h'] + gutter) + fy * (vp['h'] - ht)
+
+    return xs, ys
+
+
+class LayoutModel:
+    """Positions of images in a grid of viewports, kept between changes.
+
+    Arguments are as for grid_positions. xs and ys hold the current
+    positions. Each set_ method recomputes only what its change affects,
+    and returns a delta: a dict of arrays 'index', 'x' and 'y' for the
+    images whose position changed, and nothing else. 'recomputed' counts
+    the positions computed since creation.
+    If packing is 'justified' or 'masonry', images are packed into the
+    width of the grid, in order: justified rows aim for the viewport
+    height, masonry columns are the viewport width. wd and ht are then
+    replaced by the packed display sizes (whole pixels), and 'height' is
+    the height of the layout. Alignment changes move nothing.
+    """
+    def __init__(self,
+                 vp: dict,
+                 wd: object,
+                 ht: object,
+                 arrange: tuple = ('left', 'top'),
+                 cols: int = 2,
+                 rows: int | None = None,
+                 gutter: int | None = None,
+                 packing: str | None = None):
+        if packing not in (None, 'justified', 'masonry'):
+            raise ValueError(f'unknown packing: {packing}')
+        self.vp = dict(vp)
+        self.wd = np.array(wd, dtype=float)
+        self.ht = np.array(ht, dtype=float)
+        self.arrange = tuple(arrange)
+        self.rows, self.cols = grid_shape(len(self.wd), cols, rows)
+        self.gutter = vp['gutter'] if gutter is None else gutter
+        self.packing = packing
+        self.aspects = self.wd / np.maximum(self.ht, 1)
+
+        idx = np.arange(len(self.wd))
+        self.col = idx % self.cols
+        self.row = idx // self.cols
+        self.recomputed = 0
+
+        if packing:
+            self.xs, self.ys = self._pack()
+        else:
+            self.xs = self._x(idx)
+            self.ys = self._y(idx)
+            self.height = canvas_size(self.vp, self.rows, self.cols, self.gutter)['h']
+
+    def fractions(self, arrange: tuple) -> tuple:
+        """Alignment fractions (per column, per row) for an arrangement."""
+        if arrange == ('cc', 'cc'):
+            return centered_fractions(self.cols), centered_fractions(self.rows)
+
+        return (np.full(self.cols, H_ALIGN[arrange[0]]),
+                np.full(self.rows, V_ALIGN[arrange[1]]))
+
+    def set_arrange(self, arrange: tuple) -> dict:
+        """Change the alignment. Only an axis whose fractions change is recomputed."""
+        old_fx, old_fy = self.fractions(self.arrange)
+        new_fx, new_fy = self.fractions(arrange)
+        self.arrange = tuple(arrange)
+        if self.packing:
+            return self._moved(np.zeros(len(self.wd), dtype=bool))
+
+        all_idx = np.arange(len(self.wd))
+        x_idx = all_idx if not np.array_equal(old_fx, new_fx) else all_idx[:0]
+        y_idx = all_idx if not np.array_equal(old_fy, new_fy) else all_idx[:0]
+
+        return self._update(x_idx, y_idx)
+
+    def set_image_size(self, i: int, w: float, h: float) -> dict:
+        """Change the display size of image i. Only its position is recomputed.
+
+        In a packed layout, w and h set the image's aspect ratio, and the
+        whole layout is packed again.
+        """
+        if self.packing:
+            self.aspects[i] = w / max(h, 1)
+            return self._repack()
+
+        idx = np.array([i])
+        x_idx = idx if w != self.wd[i] else idx[:0]
+        y_idx = idx if h != self.ht[i] else idx[:0]
+        self.wd[i] = w
+        self.ht[i] = h
+
+        return self._update(x_idx, y_idx)
+
+    def set_viewport(self, vp: dict) -> dict:
+        """Change the viewport size or gutter; every position is recomputed."""
+        self.vp = dict(vp)
+        self.gutter = vp['gutter']
+        if self.packing:
+            return self._repack()
+        all_idx = np.arange(len(self.wd))
+        self.height = canvas_size(self.vp, self.rows, self.cols, self.gutter)['h']
+
+        return self._update(all_idx, all_idx)
+
+    def _pack(self) -> tuple:
+        """Pack the images; set wd, ht and height, and return x, y."""
+        width = canvas_size(self.vp, self.rows, self.cols, self.gutter)['w']
+        if self.packing == 'justified':
+            layout = justified_rows(self.aspects, width, self.vp['h'], self.gutter)
+        else:
+            layout = masonry(self.aspects, self.cols, self.vp['w'], self.gutter)
+        self.recomputed += len(self.aspects)
+
+        self.wd = np.floor(layout['w'])
+        self.ht = np.floor(layout['h'])
+        self.height = int(np.ceil(layout['height']))
+
+        return np.round(layout['x']), np.round(layout['y'])
+
+    def _repack(self) -> dict:
+        xs, ys = self._pack()
+        moved = (xs != self.xs) | (ys != self.ys)
+        self.xs, self.ys = xs, ys
+
+        return self._moved(moved)
+
+    def _x(self, idx: np.ndarray) -> np.ndarray:
+        col = self.col[idx]
+        fx = self.fractions(self.arrange)[0][col]
+        self.recomputed += len(idx)
+
+        return col * (self.vp['w'] + self.gutter) + fx * (self.vp['w'] - self.wd[idx])
+
+    def _y(self, idx: np.ndarray) -> np.ndarray:
+        row = self.row[idx]
+        fy = self.fractions(self.arrange)[1][row]
+        self.recomputed += len(idx)
+
+        return row * (self.vp['h'] + self.gutter) + fy * (self.vp['h'] - self.ht[idx])
+
+    def _update(self, x_idx: np.ndarray, y_idx: np.ndarray) -> dict:
+        """Recompute x at x_idx and y at y_idx; return the positions that moved."""
+        moved = np.zeros(len(self.wd), dtype=bool)
+        if len(x_idx):
+            new_x = self._x(x_idx)
+            moved[x_idx] |= new_x != self.xs[x_idx]
+            self.xs[x_idx] = new_x
+        if len(y_idx):
+            new_y = self._y(y_idx)
+            moved[y_idx] |= new_y != self.ys[y_idx]
+            self.ys[y_idx] = new_y
+
+        return self._moved(moved)
+
+    def _moved(self, moved: np.ndarray) -> dict:
+        index = np.flatnonzero(moved)
+
+        return {'index': index, 'x': self.xs[index], 'y': self.ys[index]}
+
+
+def vp_rects(vp: dict,
+             rows: int = 2,
+             cols: int = 2,
+             gutter: int | None = None) -> np.ndarray:
+    """Return an array of viewport rectangles, one row of x0, y0, x1, y1 each.
+
+    x1 and y1 are the last pixel inside the viewport.
+    """
+    if gutter is None:
+        gutter = vp['gutter']
+
+    row, col = np.divmod(np.arange(rows * cols), cols)
+    x0 = col * (vp['w'] + gutter)
+    y0 = row * (vp['h'] + gutter)
+
+    return np.stack([x0, y0, x0 + vp['w'] - 1, y0 + vp['h'] - 1], axis=1)
+
+
+def canvas_size(vp: dict,
+                rows: int = 2,
+                cols: int = 2,
+                gutter: int | None = None) -> dict:
+    """Return the canvas size that holds rows x cols viewports."""
+    if gutter is None:
+        gutter = vp['gutter']
+
+    return {'w': cols * vp['w'] + (cols - 1) * gutter,
+            'h': rows * vp['h'] + (rows - 1) * gutter}
+
+
+def grid_fill(vp: dict,
+              wd: object,
+              ht: object,
+              rows: int = 2,
+              cols: int = 2,
+              gutter: int | None = None) -> float:
+    """Fraction of a grid canvas covered by images of size wd x ht."""
+    size = canvas_size(vp, rows, cols, gutter)
+    area = np.sum(np.asarray(wd, dtype=float) * np.asarray(ht, dtype=float))
+
+    return float(area / (size['w'] * size['h']))
+
+
+def justified_rows(aspects: object,
+                   width: float,
+                   target_height: float,
+                   gutter: float = 0) -> dict:
+    """Lay out images in rows that exactly fill width.
+
+    aspects are image width / height. Images are taken in order, and a row
+    ends with the first image that makes it at least width wide at
+    target_height; the row is then scaled down to fit width exactly, so
+    every row height is at most target_height. The last row, if short, is
+    left at target_height. Row ends are found by binary search on the
+    cumulative widths.
+    Returns arrays x, y, w, h, plus 'row_heights', 'height' and 'fill'.
+    """
+    aspects = np.asarray(aspects, dtype=float)
+    n = len(aspects)
+    # cumulative width of images plus one gutter each, at target_height
+    cum = np.cumsum(aspects * target_height + gutter)
+
+    starts = []
+    start = 0
+    while start < n:
+        base = cum[start - 1] if start else 0.0
+        end = int(np.searchsorted(cum, base + width + gutter, side='left'))
+        starts.append(start)
+        start = end + 1
+    starts = np.asarray(starts, dtype=int)
+    ends = np.append(starts[1:], n)               # one past the last image
+
+    counts = ends - starts
+    aspect_cum = np.concatenate(([0.0], np.cumsum(aspects)))
+    aspect_sums = aspect_cum[ends] - aspect_cum[starts]
+    row_heights = (width - gutter * (counts - 1)) / aspect_sums
+    if n and (aspect_sums[-1] * target_height + gutter * (counts[-1] - 1)) < width:
+        row_heights[-1] = target_height
+
+    row = np.repeat(np.arange(len(starts)), counts)
+    h = row_heights[row]
+    w = aspects * h
+    # x: cumulative width of the images before each one, within its row
+    cum_w = np.concatenate(([0.0], np.cumsum(w + gutter)))
+    x = cum_w[:-1] - cum_w[starts][row]
+    row_tops = np.concatenate(([0.0], np.cumsum(row_heights + gutter)))
+    y = row_tops[row]
+
+    height = float(row_tops[-1] - gutter) if n else 0.0
+    fill = float(np.sum(w * h) / (width * height)) if height else 0.0
+
+    return {'x': x, 'y': y, 'w': w, 'h': h,
+            'row_heights': row_heights,
+            'height': height,
+            'fill': fill}
+
+
+def masonry(aspects: object,
+            cols: int,
+            col_width: float,
+            gutter: float = 0) -> dict:
+    """Lay out images in cols columns of col_width, each in the shortest column.
+
+    aspects are image width / height; every image is scaled to col_width.
+    The shortest column is kept in a heap, so placing n images costs
+    O(n log cols).
+    Returns arrays x, y, w, h, plus 'col_heights', 'height' and 'fill'.
+    """
+    aspects = np.asarray(aspects, dtype=float)
+    h = col_width / aspects
+    col = np.empty(len(aspects), dtype=int)
+    y = np.empty(len(aspects))
+
+    heap = [(0.0, c) for c in range(cols)]
+    for i, image_ht in enumerate(h.tolist()):
+        top, c = heapq.heappop(heap)
+        col[i] = c
+        y[i] = top
+        heapq.heappush(heap, (top + image_ht + gutter, c))
+
+    col_heights = np.zeros(cols)
+    for bottom, c in heap:
+        col_heights[c] = max(0.0, bottom - gutter)
+
+    x = col * (col_width + gutter)
+    w = np.full(len(aspects), float(col_width))
+    width = cols * col_width + (cols - 1) * gutter
+    height = float(col_heights.max()) if len(aspects) else 0.0
+    fill = float(np.sum(w * h) / (width * height)) if height else 0.0
+
+    return {'x': x, 'y': y, 'w': w, 'h': h,
+            'col_heights': col_heights,
+            'height': height,
+            'fill': fill}
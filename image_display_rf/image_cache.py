@@ -0,0 +1,480 @@
+"""
+module: image_cache.py
+
+purpose: Caches for source images and their scaled renders.
+
+comments: A pyramid holds successively halved copies of one source image.
+          Resizing from the smallest level that still covers the target
+          size costs the same whether the source is 4000 px or 400 px wide.
+          Pyramids are registered by file path, so every canvas that shows
+          a given file shares one pyramid.
+          A RenderCache keeps recently made renders, keyed by source file,
+          modification time, target size and resample filter, so toggling
+          between a few sizes does not resample again.
+          A DiskCache keeps scaled renders between runs, so a warm start
+          skips decoding and resizing.
+
+author: Russell Folks
+
+history:
+-------
+10-18-2026  creation: ImagePyramid, get_pyramid, pyramids_nbytes.
+10-18-2026  Add RenderCache, a bounded LRU cache of rendered images and
+            optional PhotoImages. Pyramids record their source key.
+10-18-2026  Guard pyramids, the pyramid registry and RenderCache with
+            locks, so images can be loaded from worker threads.
+10-18-2026  Add reduce_image(), shared by the pyramid and the
+            decode-at-size loader in canvas_ui.
+10-18-2026  Add DiskCache, a persistent cache of scaled renders with an
+            index file, LRU eviction and a size cap.
+10-18-2026  Add ImagePyramid.level_index, used by tiled rendering.
+10-18-2026  Pyramids of random-access sources (image_source.py) build each
+            level directly from the source.
+10-18-2026  Bound the pyramid registry: file pyramids are kept in an LRU
+            of MAX_FILE_PYRAMIDS, and pyramids of in-memory images live
+            only as long as the image. In-memory images get a serial
+            number for their key, instead of id(), which can be reused.
+10-18-2026  DiskCache.put converts renders to a mode PNG can store (CMYK
+            JPEGs, 32-bit and float images), and skips any it cannot save.
+10-18-2026  get_pyramid rebuilds a file's pyramid when the file's mtime has
+            changed.
+10-18-2026  render_key takes the mtime from source_key, not from the
+            pyramid, so renders of a rewritten file are not reused.
+"""
+"""
+TODO: -
+"""
+import hashlib
+import itertools
+import json
+import os
+import threading
+import time
+import weakref
+from collections import OrderedDict
+
+from PIL import Image
+
+# modes that Image.reduce accepts; other modes are converted first.
+REDUCE_MODES = ('L', 'LA', 'La', 'RGB', 'RGBA', 'RGBa', 'RGBX', 'CMYK',
+                'YCbCr', 'I', 'F')
+
+# modes a DiskCache PNG stores as they are; see png_mode().
+PNG_MODES = ('1', 'L', 'LA', 'P', 'RGB', 'RGBA')
+
+# pyramids of image files kept, least recently used dropped first.
+MAX_FILE_PYRAMIDS = 16
+
+
+# -------
+# utility
+# -------
+def image_nbytes(im: Image.Image) -> int:
+    """Approximate bytes held by a decoded image."""
+    bytes_per_band = 4 if im.mode in ('I', 'F') else 1
+
+    return im.width * im.height * len(im.getbands()) * bytes_per_band
+
+
+def png_mode(mode: str) -> str:
+    """The mode an image is converted to before it is saved as PNG."""
+    if mode in PNG_MODES:
+        return mode
+
+    return {'La': 'LA', 'PA': 'RGBA', 'RGBa': 'RGBA',
+            'I': 'L', 'I;16': 'L', 'I;16B': 'L', 'I;16L': 'L', 'F': 'L'}.get(mode, 'RGB')
+
+
+_serials = itertools.count()
+_serials_lock = threading.Lock()
+
+
+def source_key(im: Image.Image) -> tuple:
+    """Identify an image's source as (path, mtime).
+
+    Images not opened from a file are identified by a serial number, set
+    on the image the first time it is asked for.
+    """
+    path = getattr(im, 'filename', '')
+    if not path:
+        with _serials_lock:
+            if not hasattr(im, '_cache_serial'):
+                im._cache_serial = next(_serials)
+        return (f'<image {im._cache_serial}>', 0)
+
+    try:
+        mtime = os.path.getmtime(path)
+    except OSError:
+        mtime = 0
+
+    return (path, mtime)
+
+
+def reduce_image(im: Image.Image, factor: int) -> Image.Image:
+    """Image.reduce, converting modes that reduce does not accept."""
+    if im.mode not in REDUCE_MODES:
+        im = im.convert('RGBA' if 'transparency' in im.info else 'RGB')
+
+    return im.reduce(factor)
+
+
+# -------
+# pyramid
+# -------
+class ImagePyramid:
+    """Lazily built levels of one source image: full, 1/2, 1/4, ...
+
+    Level 0 is the source image itself. Each further level is made from
+    the one before it with Image.reduce(2), the first time it is needed.
+    Sources with random_access set (image_source.RawImageSource) are
+    reduced directly to the level needed, so levels in between are not
+    built and their entries in levels stay None.
+    Levels are built under a lock, since PIL images are not safe to load
+    from two threads at once.
+    """
+    def __init__(self, im: Image.Image):
+        self.levels = [im]
+        self.key = source_key(im)
+        self._lock = threading.Lock()
+
+    def level_index(self, w: int, h: int) -> int:
+        """Return the number of the smallest level at least w wide and h high.
+
+        That level is built if needed, and loaded.
+        """
+        src = self.levels[0]
+        level_w, level_h = src.width, src.height
+        n = 0
+        # reduce() rounds up, so this is the size of the next level.
+        while ((level_w + 1) // 2 >= w and (level_h + 1) // 2 >= h
+               and (level_w > 1 or level_h > 1)):
+            level_w, level_h = (level_w + 1) // 2, (level_h + 1) // 2
+            n += 1
+
+        with self._lock:
+            self.levels.extend([None] * (n + 1 - len(self.levels)))
+            if self.levels[n] is None:
+                if getattr(src, 'random_access', False):
+                    self.levels[n] = src.reduce(2 ** n)
+                else:
+                    built = max(i for i in range(n) if self.levels[i] is not None)
+                    for i in range(built + 1, n + 1):
+                        self.levels[i] = reduce_image(self.levels[i - 1], 2)
+
+            # a level that was never reduced may still be lazily loaded.
+            self.levels[n].load()
+
+        return n
+
+    def level_for(self, w: int, h: int) -> Image.Image:
+        """Return the smallest level at least w wide and h high."""
+        return self.levels[self.level_index(w, h)]
+
+    def nbytes(self, include_source: bool = False) -> int:
+        """Bytes held by the built levels, optionally including level 0."""
+        levels = self.levels if include_source else self.levels[1:]
+
+        return sum(image_nbytes(level) for level in levels if level is not None)
+
+
+_pyramids = OrderedDict()          # path -> pyramid, in LRU order
+_image_pyramids = weakref.WeakSet()  # pyramids of in-memory images
+_pyramids_lock = threading.Lock()
+
+
+def get_pyramid(im: Image.Image) -> ImagePyramid:
+    """Return the shared pyramid for an image, creating it if needed.
+
+    Images opened from a file are keyed by path, so separate Image objects
+    for the same file share one pyramid; at most MAX_FILE_PYRAMIDS are
+    kept. A pyramid made before the file was last modified is replaced by
+    one of im. The pyramid of an in-memory image is stored on the image, and
+    goes when the image does.
+    """
+    path = getattr(im, 'filename', '')
+    with _pyramids_lock:
+        if not path:
+            pyr = getattr(im, '_pyramid', None)
+            if pyr is None:
+                pyr = ImagePyramid(im)
+                im._pyramid = pyr
+                _image_pyramids.add(pyr)
+            return pyr
+
+        pyr = _pyramids.get(path)
+        if pyr is None or pyr.key != source_key(im):
+            pyr = ImagePyramid(im)
+            _pyramids[path] = pyr
+            while len(_pyramids) > MAX_FILE_PYRAMIDS:
+                _pyramids.popitem(last=False)
+        else:
+            _pyramids.move_to_end(path)
+
+    return pyr
+
+
+def pyramids_nbytes() -> int:
+    """Bytes held by the reduced levels of all pyramids."""
+    with _pyramids_lock:
+        pyramids = list(_pyramids.values()) + list(_image_pyramids)
+
+    return sum(pyr.nbytes() for pyr in pyramids)
+
+
+# ------------
+# render cache
+# ------------
+class RenderCache:
+    """Bounded LRU cache of rendered images, with optional PhotoImages.
+
+    Keys are (path, mtime, width, height, resample); see render_key().
+    When the total size of the entries exceeds max_bytes, the least
+    recently used entries are evicted. All methods are thread-safe.
+    """
+    def __init__(self, max_bytes: int = 64 * 2**20):
+        self.max_bytes = max_bytes
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = OrderedDict()    # key -> [image, photo, nbytes]
+        self._lock = threading.RLock()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def get(self, key: tuple) -> Image.Image | None:
+        """Return the cached image for key, or None."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return entry[0]
+
+    def put(self, key: tuple, im: Image.Image) -> None:
+        """Add or replace the image for key."""
+        with self._lock:
+            self.discard(key)
+            size = image_nbytes(im)
+            self._entries[key] = [im, None, size]
+            self.nbytes += size
+            self._evict()
+
+    def get_photo(self, key: tuple) -> object:
+        """Return the cached PhotoImage for key, or None."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[1] is None:
+                return None
+
+            self._entries.move_to_end(key)
+            return entry[1]
+
+    def put_photo(self, key: tuple, photo: object) -> None:
+        """Attach a PhotoImage to the entry for key, if it is cached."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return
+
+            # Tk holds photos as 32-bit pixels.
+            size = photo.width() * photo.height() * 4
+            if entry[1] is None:
+                entry[2] += size
+                self.nbytes += size
+            entry[1] = photo
+            self._evict()
+
+    def discard(self, key: tuple) -> None:
+        """Remove the entry for key, if present."""
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry is not None:
+                self.nbytes -= entry[2]
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {'entries': len(self._entries),
+                    'nbytes': self.nbytes,
+                    'hits': self.hits,
+                    'misses': self.misses,
+                    'evictions': self.evictions}
+
+    def _evict(self) -> None:
+        while self.nbytes > self.max_bytes and len(self._entries) > 1:
+            _key, entry = self._entries.popitem(last=False)
+            self.nbytes -= entry[2]
+            self.evictions += 1
+
+
+def render_key(im: Image.Image,
+               w: int,
+               h: int,
+               resample: int | None) -> tuple:
+    """Return the RenderCache key for a render of im at w, h."""
+    return source_key(im) + (w, h, resample)
+
+
+render_cache = RenderCache()
+
+
+# ----------
+# disk cache
+# ----------
+class DiskCache:
+    """Scaled renders stored on disk between runs.
+
+    Entries are keyed by source path, mtime, file size and box size. Each is
+    a PNG file named by a hash of its key. The index file maps file names
+    to their size and last use, so lookups do not touch the directory.
+    When the total size exceeds max_bytes, the least recently used files
+    are removed. Call save() to write the index after a batch of loads.
+    """
+    INDEX_NAME = 'index.json'
+
+    def __init__(self,
+                 directory: str = '.thumbcache',
+                 max_bytes: int = 256 * 2**20):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+        self._dirty = False
+
+        os.makedirs(directory, exist_ok=True)
+        try:
+            with open(os.path.join(directory, self.INDEX_NAME)) as f:
+                self._index = json.load(f)
+        except (OSError, ValueError):
+            self._index = {}
+        self.nbytes = sum(e['bytes'] for e in self._index.values())
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    @staticmethod
+    def entry_name(path: str, box: dict) -> str | None:
+        """Return the file name for a render of path fitted to box."""
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+
+        key = f"{os.path.abspath(path)}|{st.st_mtime_ns}|{st.st_size}|{box['w']}x{box['h']}"
+        return hashlib.sha1(key.encode()).hexdigest() + '.png'
+
+    def get(self, path: str, box: dict) -> Image.Image | None:
+        """Return the cached render of path for box, or None."""
+        name = self.entry_name(path, box)
+        with self._lock:
+            entry = self._index.get(name) if name else None
+            if entry is None:
+                self.misses += 1
+                return None
+
+        try:
+            im = Image.open(os.path.join(self.directory, name))
+            im.load()
+        except OSError:
+            self._drop(name)
+            with self._lock:
+                self.misses += 1
+            return None
+
+        with self._lock:
+            self.hits += 1
+            entry['used'] = time.time()
+            self._dirty = True
+
+        return im
+
+    def put(self, path: str, box: dict, im: Image.Image) -> None:
+        """Store the render of path for box.
+
+        Renders in modes PNG cannot store are converted (see png_mode);
+        a render that still cannot be saved is not cached.
+        """
+        name = self.entry_name(path, box)
+        if name is None:
+            return
+
+        file_path = os.path.join(self.directory, name)
+        if im.mode != png_mode(im.mode):
+            im = im.convert(png_mode(im.mode))
+        try:
+            im.save(file_path, 'PNG', compress_level=1)
+            size = os.path.getsize(file_path)
+        except (OSError, ValueError):
+            self._remove_file(name)
+            return
+
+        with self._lock:
+            old = self._index.get(name)
+            if old is not None:
+                self.nbytes -= old['bytes']
+            self._index[name] = {'bytes': size, 'used': time.time()}
+            self.nbytes += size
+            self._dirty = True
+            victims = self._evict()
+
+        for victim in victims:
+            self._remove_file(victim)
+
+    def save(self) -> None:
+        """Write the index file, if it has changed."""
+        with self._lock:
+            if not self._dirty:
+                return
+            data = json.dumps(self._index)
+            self._dirty = False
+
+        index_path = os.path.join(self.directory, self.INDEX_NAME)
+        tmp_path = index_path + '.tmp'
+        with open(tmp_path, 'w') as f:
+            f.write(data)
+        os.replace(tmp_path, index_path)
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {'entries': len(self._index),
+                    'nbytes': self.nbytes,
+                    'hits': self.hits,
+                    'misses': self.misses,
+                    'evictions': self.evictions}
+
+    def _evict(self) -> list:
+        """Drop least recently used entries from the index; return their names."""
+        if self.nbytes <= self.max_bytes:
+            return []
+
+        victims = []
+        for name, entry in sorted(self._index.items(), key=lambda item: item[1]['used']):
+            if self.nbytes <= self.max_bytes or len(self._index) == 1:
+                break
+            del self._index[name]
+            self.nbytes -= entry['bytes']
+            self.evictions += 1
+            victims.append(name)
+
+        return victims
+
+    def _drop(self, name: str) -> None:
+        with self._lock:
+            entry = self._index.pop(name, None)
+            if entry is not None:
+                self.nbytes -= entry['bytes']
+                self._dirty = True
+        self._remove_file(name)
+
+    def _remove_file(self, name: str) -> None:
+        try:
+            os.remove(os.path.join(self.directory, name))
+        except OSError:
+            pass
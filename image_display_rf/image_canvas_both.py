@@ -0,0 +1,235 @@
+"""
+program: image_canvas_both.py
+
+purpose: Display up to 4 images in one canvas, with constant size.
+         Display 1 image in another canvas, resizable by dragging.
+
+comments: 
+
+author: Russell Folks
+
+history:
+-------
+03-04-2024  creation
+10-13-2024  Debug the new approach to sizing static images.
+11-27-2024  Use ThemedTk for widgets.
+10-18-2026  Route <Configure> events through canvas_ui.ResizeScheduler.
+10-18-2026  Use canvas_ui.DynamicImage to keep one image item on the canvas.
+10-18-2026  Draw a NEAREST preview while resizing, and a LANCZOS render
+            once the size settles. Coalesce events without a settle delay,
+            so the preview tracks the drag.
+10-18-2026  Scale images through canvas_ui.scale_image, which uses the
+            shared image pyramid. Report pyramid memory on exit.
+10-18-2026  Cache PhotoImages of final dynamic renders. Report render cache
+            statistics on exit.
+10-18-2026  Decode and scale the static images concurrently with
+            image_loader.load_scaled. Only PhotoImage conversion runs here.
+10-18-2026  Keep scaled renders in an on-disk cache (.thumbcache), so a
+            warm start skips decoding and resizing.
+10-18-2026  Lay out the static canvas from file headers only, and show
+            placeholders while image_loader.DeferredLoader decodes.
+10-18-2026  Add main(); nothing runs on import. Load styles_ttk with
+            sibling_modules.import_sibling. ttkthemes is imported in main()
+            and ImageTk in show_loaded_image().
+10-18-2026  Make the dynamic canvas's final renders in an
+            image_loader.LoadService, off the Tk thread.
+10-18-2026  The dynamic canvas writes frames into one photo image with
+            photo_transfer.py; its source is converted to RGB once.
+10-18-2026  Drop cache_photos from the dynamic canvas: with transfer, its
+            final renders go into the same photo as its previews.
+10-18-2026  Move into the image_display_rf package. Take the images and
+            disk cache directories from --images and --cache-dir, or else
+            from the project directory (project_paths.py), not from the
+            working directory.
+"""
+"""
+TODO: - add frame below the canvas, for other widgets, so the
+        root geometry can be calculated accurately.
+      - consider calculating default_dims instead of hardcoding it.
+        It's more complex here than in image_canvas_static.py because
+        there is more than one canvas here.
+"""
+
+import argparse
+import os
+import tkinter as tk
+from tkinter import ttk
+
+from PIL import Image
+
+from . import canvas_ui as cnv
+from . import image_cache
+from . import image_loader
+from . import photo_transfer
+from . import project_paths
+from .sibling_modules import import_sibling
+
+def reset_window_size(dims: str) -> None:
+    root.geometry(dims)
+
+
+def show_loaded_image(i: int, result: dict) -> None:
+    """Replace placeholder i in the static canvas with its decoded image."""
+    from PIL import ImageTk
+
+    myPhotoImages[i] = ImageTk.PhotoImage(result['im_resize_new'])
+    canv_static1.itemconfigure(imid_list[i], image=myPhotoImages[i])
+    canv_static1.delete('placeholder' + str(i))
+
+
+def parse_args(argv: list | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description='Show a fixed-size canvas and a resizable one.')
+    project_paths.add_arguments(parser)
+
+    return parser.parse_args(argv)
+
+
+def main(argv: list | None = None) -> None:
+    """Open the window with both canvases, and run until it is closed."""
+    global root, canv_static1, imid_list, myPhotoImages
+
+    args = parse_args(argv)
+    image_dir = project_paths.images_dir(args.images)
+    thumb_dir = project_paths.cache_dir(image_dir, args.cache_dir)
+
+    from ttkthemes import ThemedTk
+
+    sttk = import_sibling('styles_ttk', 'styles')
+
+    # app window
+    default_dims = "600x800"
+
+    root = ThemedTk()
+    root.geometry (default_dims)
+    root.minsize(480, 600)
+    root.resizable(True, True)
+    root.title("static and dynamic canvases, ttk, pack")
+
+    style2 = sttk.create_styles()
+
+    viewport1 = {'w': 200, 'h': 150, 'gutter': 10}
+    my_pady = 10
+
+    canvas_reconfig = {'w': viewport1['w'] * 2 + viewport1['gutter'],
+                       'h': viewport1['h']}
+
+    lab = ttk.Label(root, text="canvas 1: multiple fixed images\n canvas 2: one image, resizable",
+                    style="MyLabel.TLabel")
+    lab.pack(pady=my_pady)
+
+    image_paths = ['four moods_1.png',
+                   'forest of death_1.png',
+                   'four moods_2.png',
+                   'parapsycho_1.png']
+    myPhotoImages = [None] * len(image_paths)
+    heights = []
+    widths = []
+
+    # Stage 1: read file headers only, and compute the layout.
+    print('static images, native w,h and resized w,h:')
+    sizes = image_loader.read_sizes([os.path.join(image_dir, n) for n in image_paths], viewport1)
+
+    for i, n in enumerate(image_paths):
+        heights.append(sizes[i]['h'])
+        widths.append(sizes[i]['w'])
+    #    print(f"{im.width}, {im.height}")
+    #    print(f"    {imsize['w']}, {imsize['h']}")
+    #    print()
+
+    canv_static1 = tk.Canvas(root, background = "green")
+
+    arrangement = ('left', 'top')
+    positions = cnv.get_positions(viewport1, widths, heights, arrangement)
+
+    imid_list = []
+    for i, n in enumerate(image_paths):
+        tagname = "tag_im" + str(i)
+        imid = canv_static1.create_image(positions[i].x, positions[i].y, anchor=tk.NW,
+                                      tag = tagname)
+        imid_list.append(imid)
+
+    for i, n in enumerate(image_paths):
+        tagname = "tag_im" + str(i)
+        canv_static1.create_rectangle(positions[i].x, positions[i].y,
+                                      positions[i].x + widths[i] - 1, positions[i].y + heights[i] - 1,
+                                      fill='gray50', outline='',
+                                      tags=(tagname, 'placeholder' + str(i)))
+
+    # Stage 2: decode in the background, filling viewports as images are ready.
+    thumb_cache = image_cache.DiskCache(thumb_dir)
+    loader = image_loader.DeferredLoader(root,
+                                         [os.path.join(image_dir, n) for n in image_paths],
+                                         viewport1,
+                                         show_loaded_image,
+                                         disk_cache=thumb_cache)
+    loader.start()
+
+    canv_static1.pack(pady=10)
+    canv_static1.update()
+
+    # Scale the canvas to hold the images with no extra space.
+    # canvas_config_ht = max(sum(heights[0::2]), sum(heights[1::2])) + viewport['gutter']
+    # original:
+    canvas_reconfig['h'] = max(sum(heights[0::2]) + viewport1['gutter'], sum(heights[1::2]) + viewport1['gutter']) + (viewport1['gutter'] * 2)
+    # LOCAL:
+    # canvas_reconfig['h'] = max(sum(heights[0::2]), sum([heights[1], heights[3]]) + viewport1['gutter'])
+
+    print(f"static canv reconfig w,h: {canvas_reconfig['w']}, {canvas_reconfig['h']}")
+
+    canv_static1.configure(width=canvas_reconfig['w'], height=canvas_reconfig['h'])
+    # ----------
+
+
+    im_dyn = Image.open(os.path.join(image_dir, image_paths[3]))
+
+    viewport2 = {'w': 400, 'h': 300, 'gutter': 10}
+
+    canv_dyn1 = tk.Canvas(root,
+                          width=viewport2['w'],
+                          height=viewport2['h'],
+                          highlightthickness=0,
+                          background='green')
+
+    print(f'viewport h, w: {viewport2["h"]}, {viewport2["w"]}')
+
+    # canv_dyn1.bind('<Configure>', lambda ev, im=im_dyn, vp=viewport2, canv=canv_dyn1: cnv.resize_images(ev, im, vp, canv))
+    render_service = image_loader.LoadService(root, workers=1)
+    dyn_image1 = cnv.DynamicImage(canv_dyn1, im_dyn,
+                                  preview_filter=Image.Resampling.NEAREST,
+                                  final_filter=Image.Resampling.LANCZOS,
+                                  final_ms=150,
+                                  loader=render_service,
+                                  transfer=True)
+    resize_sched = cnv.ResizeScheduler(canv_dyn1,
+                                       lambda ev, dyn=dyn_image1: cnv.resize_images(ev, dyn),
+                                       settle_ms=0)
+    canv_dyn1.bind('<Configure>', resize_sched.schedule)
+    canv_dyn1.pack(fill="both", expand=True)
+
+
+    # ----------
+    but_reset_size = ttk.Button(root,
+                                text="reset window size",
+                                command=lambda dims=default_dims: reset_window_size(dims),
+                                style="MyButton1.TButton")
+    but_reset_size.pack(pady=10)
+
+    btnq = ttk.Button(root,
+                      text="Quit",
+                      command=root.quit,
+                      style="MyButton1.TButton")
+    btnq.pack(pady=10)
+    root.mainloop()
+    render_service.shutdown()
+    print(f'resize events: rendered {resize_sched.rendered}, dropped {resize_sched.dropped}')
+    print(f'final renders: {render_service.stats()}')
+    print(f'photo transfer conversions: {photo_transfer.stats()}')
+    print(f'image pyramid memory: {image_cache.pyramids_nbytes()} bytes')
+    print(f'render cache: {image_cache.render_cache.stats()}')
+    print(f'disk cache: {thumb_cache.stats()}')
+    for i, exc in loader.failed:
+        print(f'could not load {loader.paths[i]}: {exc}')
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,225 @@
+"""
+program: image_canvas_dyn.py
+
+purpose: Display an image in a canvas, and allow resizing
+         as window dimensions change.
+
+comments: 
+
+author: Russell Folks
+
+history:
+-------
+01-31-2024  creation
+02-08-2024  Make structure similar to image_disp_1canvas.py.
+02-21-2024  Use type-hinting in function signatures.
+02-21-2024  Structure the code like image_disp_1canvas.py (non-resizable canvas).
+08-26-2024  Added code (disabled) to scale the canvas to smaller images.
+08-27-2024  Update the handling of geometry: calculate size of canvas and UI.
+            Reorganize code, using image_canvas_static.py as a model.
+10-22-2024  Minor whitespace and other order-of-steps changes for consistency
+            with image_canvas_static.py.
+11-27-2024  Remove unused function(s) and paramter(s). Use ThemedTk for widgets.
+10-18-2026  Route <Configure> events through canvas_ui.ResizeScheduler.
+10-18-2026  Use canvas_ui.DynamicImage to keep one image item on the canvas.
+10-18-2026  Draw a NEAREST preview while resizing, and a LANCZOS render
+            once the size settles. Coalesce events without a settle delay,
+            so the preview tracks the drag.
+10-18-2026  Report image pyramid memory on exit.
+10-18-2026  Cache PhotoImages of final dynamic renders. Report render cache
+            statistics on exit.
+10-18-2026  Draw images larger than tiled_min_pixels as tiles, with
+            tiled_canvas.TiledImage.
+10-18-2026  Open the image with image_source.open_image, which memory-maps
+            uncompressed TIFFs.
+10-18-2026  Add main(); nothing runs on import. styles_ttk comes from
+            sibling_modules.import_sibling, canvas_ui from a plain import,
+            and ttkthemes is imported in main().
+10-18-2026  Make final renders in an image_loader.LoadService, off the Tk
+            thread; renders for superseded sizes are dropped.
+10-18-2026  Write frames into one photo image with photo_transfer.py.
+10-18-2026  Play animated images with animation.py. On resize, frames are
+            rescaled in the render service while the old ones play.
+10-18-2026  Decode animation frames no larger than the screen. Cancel a
+            pending final render when an animation takes over the item.
+10-18-2026  Report an image that cannot be opened, or is too large to
+            decode and cannot be memory-mapped, and exit.
+10-18-2026  Drop cache_photos: with transfer, final renders go into the
+            same photo as previews.
+10-18-2026  Move into the image_display_rf package. Take the images
+            directory from --images, or else from the project directory
+            (project_paths.py), not from the working directory.
+"""
+"""
+TODO: - 
+"""
+import argparse
+import os
+import tkinter as tk
+from tkinter import ttk
+
+from PIL import Image
+
+from . import animation
+from . import canvas_ui as cnv_ui
+from . import image_cache
+from . import image_loader
+from . import image_source
+from . import photo_transfer
+from . import project_paths
+from . import tiled_canvas
+from .sibling_modules import import_sibling
+
+def reset_window_size(dims: str) -> None:
+    # print(f'geometry: {root.geometry()}')
+    root.geometry(dims)
+    # print(f'geometry: {root.geometry()}')
+
+
+def parse_args(argv: list | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description='Show an image in a resizable canvas.')
+    project_paths.add_arguments(parser)
+
+    return parser.parse_args(argv)
+
+
+def main(argv: list | None = None) -> None:
+    """Open the window with a resizable image, and run until it is closed."""
+    global root
+
+    args = parse_args(argv)
+    image_dir = project_paths.images_dir(args.images)
+
+    from ttkthemes import ThemedTk
+
+    sttk = import_sibling('styles_ttk', 'styles')
+
+    # app window
+    root = ThemedTk()
+    root.resizable(True, True)
+    root.title("dynamic canvas, ttk, pack")
+
+    default_dims = ""
+    style2 = sttk.create_styles()
+
+    viewport = {'w': 400, 'h': 300, 'gutter': 10}
+    my_pady = 10
+
+    lab = ttk.Label(root, text="image in a resizable canvas",
+                    style="MyLabel.TLabel")
+    lab.pack(pady=my_pady)
+
+    image_path = os.path.join(image_dir, "parapsycho_1.png")
+    # uncompressed TIFFs are memory-mapped, not read into memory.
+    try:
+        im1 = image_source.open_image(image_path)
+    except (OSError, Image.DecompressionBombError) as exc:
+        print(f'cannot open {image_path}: {exc}')
+        root.destroy()
+        return
+    imsize = cnv_ui.init_image_size(im1, viewport)
+
+    # Images with more pixels than this are drawn as tiles (see tiled_canvas.py).
+    tiled_min_pixels = 16_000_000
+    use_tiles = im1.width * im1.height > tiled_min_pixels
+
+    canv_dyn1 = tk.Canvas(root,
+                          width=viewport['w'],
+                          height=viewport['h'],
+                          highlightthickness=0,
+                          background='green')
+    canv_dyn1.pack(fill='both', expand=True)
+
+    canv_dyn1.configure(width=viewport['w'], height=viewport['h'])
+    if use_tiles:
+        tiled_image1 = tiled_canvas.TiledImage(canv_dyn1, im1, tile_size=256)
+        resize_callback = tiled_image1.resize
+    else:
+        params = cnv_ui.calc_resize_to_vp(viewport, im1)
+        print(params)
+
+        render_service = image_loader.LoadService(root, workers=1)
+        dyn_image1 = cnv_ui.DynamicImage(canv_dyn1, im1,
+                                         preview_filter=Image.Resampling.NEAREST,
+                                         final_filter=Image.Resampling.LANCZOS,
+                                         final_ms=150,
+                                         loader=render_service,
+                                         transfer=True)
+
+        # An animated image replaces the still one once its frames are
+        # decoded; after that, resizing rescales the animation's frames.
+        anim_clock = animation.AnimationClock(root)
+        anim_players = {}
+
+        def start_animation(anim: object) -> None:
+            if anim is None:
+                return
+            # a final render still pending would replace the first frame.
+            dyn_image1.cancel_final()
+            player = animation.AnimatedImage(canv_dyn1, dyn_image1.item, anim, anim_clock,
+                                             loader=render_service)
+            player.fit_to({'w': canv_dyn1.winfo_width(), 'h': canv_dyn1.winfo_height()})
+            player.start()
+            anim_players['dyn'] = player
+
+        def resize_callback(ev: tk.Event) -> None:
+            if 'dyn' in anim_players:
+                anim_players['dyn'].fit_to({'w': ev.width, 'h': ev.height})
+            else:
+                cnv_ui.resize_images(ev, dyn_image1)
+
+        render_service.submit('animation', animation.load_animation, image_path,
+                              photo_transfer.widget_rgb(canv_dyn1),
+                              {'w': root.winfo_screenwidth(), 'h': root.winfo_screenheight()},
+                              on_done=start_animation)
+
+    resize_sched = cnv_ui.ResizeScheduler(canv_dyn1,
+                                          resize_callback,
+                                          settle_ms=0)
+    canv_dyn1.bind('<Configure>', resize_sched.schedule)
+    canv_dyn1.addtag_all("all")
+
+    # UI elements ----------
+    ui_fr = ttk.Frame(root, relief='groove')
+
+    but_reset_size = ttk.Button(ui_fr, text="reset image size",
+                                command=lambda dims=default_dims: reset_window_size(dims),
+                                style="MyButton1.TButton")
+    but_reset_size.pack(padx=5, pady=10)
+
+    ui_fr.pack(side='top', ipadx=10, ipady=10, padx=5, pady=5)
+    ui_fr.update()
+
+    btnq = ttk.Button(root,
+                      text="Quit",
+                      command=root.quit,
+                      style="MyButton1.TButton")
+    btnq.pack(side="top")#, fill='x', padx=10)
+
+    # show some layout dimensions
+    # ----
+    # print(f'canv_static1 h,w: {canv_static1.winfo_height()}, {canv_static1.winfo_width()}')
+    # print(f'ui_fr h,w: {ui_fr.winfo_height()}, {ui_fr.winfo_width()}')
+    # print(f'lab h,w: {lab.winfo_height()}, {lab.winfo_width()}')
+
+    total_ht = canv_dyn1.winfo_height() + ui_fr.winfo_height()
+    total_wd = max(lab.winfo_width(), canv_dyn1.winfo_width(), ui_fr.winfo_width())
+    default_dims = f'{total_wd}x{total_ht}'
+
+    root.minsize(total_wd, total_ht)
+    root.mainloop()
+    print(f'resize events: rendered {resize_sched.rendered}, dropped {resize_sched.dropped}')
+    print(f'image pyramid memory: {image_cache.pyramids_nbytes()} bytes')
+    print(f'render cache: {image_cache.render_cache.stats()}')
+    if not use_tiles:
+        render_service.shutdown()
+        print(f'final renders: {render_service.stats()}')
+        print(f'photo transfer conversions: {photo_transfer.stats()}')
+        if anim_players:
+            print(f"animation: {anim_clock.ticks} clock ticks, {anim_players['dyn'].stats()}")
+    if use_tiles:
+        print(f'tiles: {tiled_image1.item_count} canvas items, cache {tiled_image1.tile_cache.stats()}')
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+"""
+program: image_canvas_gallery.py
+
+purpose: Display every image in a directory in a scrollable gallery canvas.
+
+comments: Only tiles in or near the visible region have PhotoImages and
+          canvas items (see gallery_canvas.py), so the gallery can hold any
+          number of images. Pass a directory as the first argument;
+          the default is images/ in the project directory (see
+          project_paths.py). The directory is rescanned every second,
+          and images added, removed or changed appear in the gallery.
+
+author: Russell Folks
+
+history:
+-------
+10-18-2026  creation
+10-18-2026  Prefetch tiles ahead of scrolling; report prefetch statistics.
+10-18-2026  Add main(), for the image-canvas-gallery console script. Load
+            styles_ttk with sibling_modules.import_sibling.
+10-18-2026  List the directory with image_watch.DirectoryIndex, and rescan
+            it every second; the gallery reloads only changed tiles.
+10-18-2026  Load tiles that were not prefetched in the gallery's
+            LoadService, so scrolling never waits on a decode.
+10-18-2026  Move into the image_display_rf package. Parse arguments with
+            argparse. The default directory is images/ in the project
+            (project_paths.py), not in the working directory; the disk
+            cache and directory index go beside it, or in --cache-dir.
+"""
+"""
+TODO: -
+"""
+import argparse
+import os
+from tkinter import ttk
+
+from . import gallery_canvas
+from . import image_cache
+from . import image_watch
+from . import project_paths
+from .sibling_modules import import_sibling
+
+
+def parse_args(argv: list | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description='Show a directory of images in a scrolling gallery.')
+    parser.add_argument('directory', nargs='?', default=None,
+                        help='directory of images (default: images/ in the project)')
+    parser.add_argument('--cache-dir', default=None,
+                        help='disk cache directory (default: .thumbcache beside the images)')
+
+    return parser.parse_args(argv)
+
+
+def main(argv: list | None = None) -> None:
+    """Open a gallery of a directory of images, and run until it is closed."""
+    args = parse_args(argv)
+    image_dir = project_paths.images_dir(args.directory)
+    thumb_dir = project_paths.cache_dir(image_dir, args.cache_dir)
+
+    from ttkthemes import ThemedTk
+
+    sttk = import_sibling('styles_ttk', 'styles')
+
+    # app window
+    root = ThemedTk()
+    root.resizable(True, True)
+    root.title("gallery canvas, ttk, pack")
+
+    style2 = sttk.create_styles()
+
+    viewport = {'w': 200, 'h': 150, 'gutter': 10}
+    my_pady = 10
+
+    dir_index = image_watch.DirectoryIndex(image_dir,
+                                           index_file=os.path.join(thumb_dir, 'dir_index.json'))
+    dir_index.scan()
+    image_paths = dir_index.paths()
+
+    lab = ttk.Label(root, text=f"{len(image_paths)} images in a scrollable gallery",
+                    style="MyLabel.TLabel")
+    lab.pack(pady=my_pady)
+
+    thumb_cache = image_cache.DiskCache(thumb_dir)
+    gallery = gallery_canvas.GalleryCanvas(root,
+                                           image_paths,
+                                           viewport,
+                                           cols=4,
+                                           visible_rows=3,
+                                           disk_cache=thumb_cache,
+                                           prefetch_workers=2,
+                                           load_workers=2,
+                                           background='green')
+    gallery.pack(fill='both', expand=True, padx=10)
+
+    def on_dir_change(changes: dict) -> None:
+        paths = dir_index.paths()
+        gallery.set_paths(paths, changes['modified'])
+        lab.configure(text=f"{len(paths)} images in a scrollable gallery")
+
+    watcher = image_watch.DirectoryWatcher(root, dir_index, on_dir_change, poll_ms=1000)
+    watcher.start()
+
+    btnq = ttk.Button(root,
+                      text="Quit",
+                      command=root.quit,
+                      style="MyButton1.TButton")
+    btnq.pack(pady=my_pady)
+    root.mainloop()
+    thumb_cache.save()
+    dir_index.save()
+    print(f'gallery: {gallery.item_count} canvas items, {gallery.photo_count} photos')
+    print(f'prefetch: {gallery.prefetcher.stats()}')
+    print(f'on-demand loads: {gallery.loader.stats()}, {gallery.load_errors} failed')
+    print(f'directory index: {dir_index.scans} scans, {dir_index.headers_read} headers read')
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,487 @@
+"""
+program: image_canvas_static.py
+
+purpose: Display up to 4 images in one canvas, with constant size.
+
+comments: Display viewports are set to a height-width ratio of 4:3.
+          Control widgets allow the images to be horizontally and
+          vetically justified different ways within their viewports.
+
+author: Russell Folks
+
+history:
+-------
+07-24-2024  creation
+...
+09-03-2024  Test align_images and align_images_2 with a list of values slightly
+            different from 'widths'. This works, but should the code prevent
+            images from overflowing the viewport?
+09-05-2024  Type-hint the event parameter in align_images, add comments.
+            Remove the button to align images.
+09-07-2024  Test canvas_ui.py/get_1_posn, to set image positions individually.
+09-12-2024  Use canvas_ui,py/get_positions to get 1-4 image positions.
+            get_1_posn is not directly called in this module. Remove most
+            comments around align_images().
+09-16-2024  Disable reset_window_size() and its button: this app does not use
+            resizable canvas.
+10-22-2024  Update module header, remove old commented code.
+10-24-2024  Add button to center images in the whole canvas.
+10-26-2024  Add functionality for the centering button.
+11-25-2024  Address function parameter warnings (default None in align_images, names
+            that shadow the enclosing scope, etc.) Load and use ttkthemes.
+11-26-2024  Simplify order_by_size() by using zip().
+11-27-2024  Recommit.
+11-28-2024  Update README file. Rename styles_ttk to sttk to conform with other
+            projects.
+06-25-2025  Rewrite docstring for order_by_size. Begin implementing custom
+            object for image attributes. Rewrite order_by_size().
+10-18-2026  Scale images through canvas_ui.scale_image, which uses the
+            shared image pyramid. Report pyramid memory on exit.
+10-18-2026  Report render cache statistics on exit.
+10-18-2026  Decode and scale all images concurrently with
+            image_loader.load_scaled. Only PhotoImage conversion runs here.
+10-18-2026  Keep scaled renders in an on-disk cache (.thumbcache), so a
+            warm start skips decoding and resizing.
+10-18-2026  Lay out from file headers only, and show placeholders while
+            image_loader.DeferredLoader decodes in the background. Keep
+            widths and heights in display order, and pass them to
+            get_positions. set_all_posn moves items by tag, so
+            placeholders move with their images.
+10-18-2026  set_all_posn and show_vp_borders handle any number of images
+            and viewports, using grid_layout.py.
+10-18-2026  set_all_posn moves images with canvas_ui.BatchPlacer: one Tcl
+            call per alignment change, skipping images already in place.
+10-18-2026  Move order_by_size_new and ImageObject to render_core.py, for
+            use by contact_sheet.py.
+10-18-2026  Keep positions in a grid_layout.LayoutModel. Alignment changes
+            recompute only the affected axis, and move_changed (replacing
+            set_all_posn) sends only the images that moved to the canvas.
+10-18-2026  Move the window setup into main(). Load styles_ttk and
+            tool_classes with sibling_modules.import_sibling, and canvas_ui
+            with a plain import. ttkthemes and ImageTk are imported on use.
+10-18-2026  Keep image sizes in an image_catalog.ImageCatalog, instead of
+            a list of ImageObject and a dict by path.
+10-18-2026  Play animated GIF, APNG and WebP images with animation.py, on
+            one shared clock.
+10-18-2026  Add the packing setting: 'justified' or 'masonry' lays images
+            out with grid_layout's packed layouts, through LayoutModel,
+            instead of ordering them into viewports.
+10-18-2026  Decode animation frames no larger than their box, and remove
+            the placeholder when an animation starts.
+10-18-2026  Move into the image_display_rf package. Take the images and
+            disk cache directories from --images and --cache-dir, or else
+            from the project directory (project_paths.py), not from the
+            working directory.
+"""
+"""
+TODO: 
+    1. Replace the two custui/FramedCombo with tool_classes/ComboboxFrame.
+    2. If only two images, need option to display side-by-side or 1st-over-2nd.
+    3. Refactor some variable names (like in enumerate statements) for clarity.
+    4. Move lengthy comments to a 'notes' file, if still needed.
+"""
+
+import argparse
+import os
+import tkinter as tk
+from tkinter import ttk
+
+from . import animation
+from . import canvas_ui as cnv_ui
+from . import grid_layout
+from . import image_cache
+from . import image_catalog
+from . import image_loader
+from . import photo_transfer
+from . import project_paths
+from . import render_core
+from .sibling_modules import import_sibling
+
+# custui = SourceFileLoader("custui", "../pandas_data_RF/rf_custom_ui.py").load_module()
+
+def move_changed(placer: object, delta: dict) -> None:
+    """Move the images in a layout delta, in one Tcl call.
+
+    placer is a canvas_ui.BatchPlacer for the canvas, and delta is returned
+    by a grid_layout.LayoutModel change; it lists only images that moved.
+    """
+    tags = ['tag_im' + str(i) for i in delta['index'].tolist()]
+    placer.place(tags, delta['x'].tolist(), delta['y'].tolist())
+
+
+def show_loaded_image(i: int, result: dict) -> None:
+    """Replace the placeholder in display slot i with its decoded image."""
+    from PIL import ImageTk
+
+    myPhotoImages[i] = ImageTk.PhotoImage(result['im_resize_new'])
+    canv_static1.itemconfigure(imid_list[i], image=myPhotoImages[i])
+    canv_static1.delete('placeholder' + str(i))
+
+
+def order_by_size(dims: list, paths: list) -> list:
+    """Find the 2 images of greatest dimension.
+
+    argument dims specifies the dimension, as image widths or heights.
+    If heights are passed, the display arrangement is given by diagram (1),
+    if widths are passed, the display arrangement is given by diagram (2).
+    (1)                            (2)
+    tallest-----x                  widest-----x
+       |         |           OR:     |        |
+       x----next_tallest             x----next_widest
+
+    This function should only be called if len(dims) > 2. For 1 or 2
+    images, this function does not manage display arrangement.
+    """
+    num_items = len(dims)
+
+    sizes_paths = zip(dims, paths)
+    sizes_paths_tuple = tuple(sizes_paths)
+    s_p_t_sorted = sorted(sizes_paths_tuple)
+
+    if num_items == 4:
+        newpaths = [s_p_t_sorted[3][1], s_p_t_sorted[0][1], s_p_t_sorted[1][1], s_p_t_sorted[2][1]]
+    else:
+        if num_items == 3:
+            newpaths = [s_p_t_sorted[2][1], s_p_t_sorted[1][1], s_p_t_sorted[0][1]]
+        else:
+            newpaths = [s_p_t_sorted[1][1], s_p_t_sorted[0][1]]
+
+    # print(f'old: newpaths: {newpaths}')
+    return newpaths
+
+
+"""
+Callback function executed when a Combobox item is selected in class
+FramedCombobox. See the FramedCombo instance below.
+"""
+# method 1
+# --------
+def align_images(ev: tk.Event) -> None:
+    """Set user-selected image alignment, moving only images that change."""
+    h = horizontal_align.get()
+    v = vertical_align.get()
+
+    delta = layout1.set_arrange((h, v))
+    move_changed(placer1, delta)
+
+
+def show_vp_borders(canv: object,
+                    vp: dict,
+                    rows: int = 2,
+                    cols: int = 2) -> None:
+    """Display rectangles to show the viewport (vp) borders within a canvas.
+
+    Calculation of rectangle size and location is independent of vp size,
+    but as an example calculation, assume viewports 200-wide, 150-high, and
+    gutter between viewports of 10. The upper-left viewport is then
+    (0, 0) to (199, 149), and the one to its right is (210, 0) to (409, 149).
+    """
+    for rect in grid_layout.vp_rects(vp, rows, cols).tolist():
+        canv.create_rectangle(rect)
+
+
+def align_images_canv_centered(var):
+    """Center images relative to the canvas as a whole."""
+    v = var.get()
+    if v == 1:
+        # centered = True
+        delta = layout1.set_arrange(('cc', 'cc'))
+        move_changed(placer1, delta)
+
+        # Disable alignment Comboboxes
+        # This method works, but is a little verbose
+        # It could be a function if there is a need to find a
+        #  particular type of child widget.
+        v_cb_widgets = [c for c in v_choice.winfo_children() if isinstance(c, tk.ttk.Combobox)]
+        v_cb_widgets[0].configure(state='disabled')
+        h_cb_widgets = [c for c in h_choice.winfo_children() if isinstance(c, tk.ttk.Combobox)]
+        h_cb_widgets[0].configure(state='disabled')
+
+    else:
+        # centered = False
+        # enable alignment Comboboxes
+        v_cb_widgets = [c for c in v_choice.winfo_children() if isinstance(c, tk.ttk.Combobox)]
+        v_cb_widgets[0].configure(state='readonly')
+        h_cb_widgets = [c for c in h_choice.winfo_children() if isinstance(c, tk.ttk.Combobox)]
+        h_cb_widgets[0].configure(state='readonly')
+
+        # align images as specified by the Comboboxes
+        noev = tk.Event()    # TODO: is this necessary?
+        align_images(noev)
+
+
+def parse_args(argv: list | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description='Show up to four images in a fixed-size canvas.')
+    project_paths.add_arguments(parser)
+
+    return parser.parse_args(argv)
+
+
+def main(argv: list | None = None) -> None:
+    """Lay out the images, open the window, and run until it is closed."""
+    global canv_static1, imid_list, myPhotoImages, layout1, placer1
+    global horizontal_align, vertical_align, v_choice, h_choice
+
+    args = parse_args(argv)
+    image_dir = project_paths.images_dir(args.images)
+    thumb_dir = project_paths.cache_dir(image_dir, args.cache_dir)
+
+    from ttkthemes import ThemedTk
+
+    sttk = import_sibling('styles_ttk', 'styles')
+    tc = import_sibling('tool_classes', 'utilities')
+
+    # root = ThemedTk(theme='elegance')    # spacing a little off with styles_ttk.py, unchecked cb looks gray
+    # root = ThemedTk(theme='radiance')    # 'for ubuntu', okay
+    root = ThemedTk()                    # better
+
+    root.resizable(True, True)
+    root.title("static canvas, ttk")
+
+    default_dims = ""
+    style2 = sttk.create_styles()
+
+    viewport1 = {'w': 200, 'h': 150, 'gutter': 10}
+    my_pady = 10
+
+    centered = False
+    show_layout = True
+    # 'justified' or 'masonry' packs the images by aspect ratio, in the
+    # canvas width, in place of ordering them into viewports.
+    packing = None
+    conform_canvas_to_images = False
+
+    canvas_reconfig = {'w': viewport1['w'] * 2 + viewport1['gutter'],
+                       'h': viewport1['h'] * 2 + viewport1['gutter']}
+
+    lab = ttk.Label(root, text="up to 4 images in a fixed-size canvas",
+                    style="MyLabel.TLabel")
+    lab.pack(pady=my_pady)
+
+    image_paths = ['four moods_2.png',      # tall
+                   'forest of death_1.png', # tall
+                   'parapsycho_1.png',      # wide
+                   'four moods_1.png',      # wide
+                   ]
+    # test with 3 images
+    # image_paths = ['four moods_2.png',
+    #                'forest of death_1.png',
+    #                'parapsycho_1.png'
+    #                ]
+
+    # test with 2 images
+    # image_paths = ['forest of death_1.png',
+    #                'parapsycho_1.png'
+    #                ]
+    # heights_start = []
+    # widths_start = []
+
+    # Stage 1: read file headers only, and compute the complete layout.
+    sizes = image_loader.read_sizes([os.path.join(image_dir, n) for n in image_paths], viewport1)
+    catalog = image_catalog.ImageCatalog.from_sizes(image_paths, sizes)
+
+    if packing:
+        new_image_paths = list(image_paths)
+    else:
+        new_image_paths = render_core.order_by_size_new(catalog, 'width')
+
+    # new_image_paths = order_by_size(widths_start, image_paths)
+
+    # the catalog in display order
+    shown = catalog.take(catalog.ids_of(new_image_paths))
+
+    canv_static1 = tk.Canvas(root, background="green")
+    canv_static1.pack(padx=10, pady=10)
+
+    if centered:
+        arrangement = ('cc', 'cc')
+    else:
+        arrangement = ('left', 'top')
+
+    # positions are kept by the layout model, and updated by deltas.
+    layout1 = grid_layout.LayoutModel(viewport1, shown.widths, shown.heights, arrangement,
+                                      cols=2, rows=2, packing=packing)
+    xs = layout1.xs.tolist()
+    ys = layout1.ys.tolist()
+    # display sizes: fitted to the viewport, or set by the packed layout.
+    widths = layout1.wd.astype(int).tolist()
+    heights = layout1.ht.astype(int).tolist()
+    if packing:
+        canvas_reconfig['h'] = layout1.height
+
+    # Image items are created empty, with ids 1-4; a placeholder rectangle
+    # shares each image's tag until the image is decoded.
+    myPhotoImages = [None] * len(new_image_paths)
+    imid_list = []
+    for i, n in enumerate(new_image_paths):
+        tagname = "tag_im" + str(i)
+        # print(f'position {i}: {xs[i]}, {ys[i]}')
+        imid = canv_static1.create_image(xs[i], ys[i], anchor=tk.NW,
+                                         tag = tagname)
+        imid_list.append(imid)
+
+    for i, n in enumerate(new_image_paths):
+        tagname = "tag_im" + str(i)
+        canv_static1.create_rectangle(xs[i], ys[i],
+                                      xs[i] + widths[i] - 1, ys[i] + heights[i] - 1,
+                                      fill='gray50', outline='',
+                                      tags=(tagname, 'placeholder' + str(i)))
+
+    placer1 = cnv_ui.BatchPlacer(canv_static1)
+    placer1.remember(["tag_im" + str(i) for i in range(len(new_image_paths))],
+                     xs,
+                     ys)
+
+    # packed images are each fitted to their own box.
+    boxes = [{'w': w, 'h': h} for w, h in zip(widths, heights)] if packing else None
+
+    # Stage 2: decode in the background, filling viewports as images are ready.
+    thumb_cache = image_cache.DiskCache(thumb_dir)
+    loader = image_loader.DeferredLoader(root,
+                                         [os.path.join(image_dir, n) for n in new_image_paths],
+                                         viewport1,
+                                         show_loaded_image,
+                                         disk_cache=thumb_cache,
+                                         boxes=boxes)
+    loader.start()
+
+    # Animated images play once all their frames are decoded. Every
+    # animation on the canvas runs on one clock.
+    anim_clock = animation.AnimationClock(root)
+    anim_service = image_loader.LoadService(root, workers=2)
+    anim_players = {}
+
+    def start_animation(i: int, anim: object) -> None:
+        if anim is None:
+            return
+        canv_static1.delete('placeholder' + str(i))
+        player = animation.AnimatedImage(canv_static1, imid_list[i], anim, anim_clock,
+                                         loader=anim_service)
+        player.fit_to(boxes[i] if packing else viewport1)
+        player.start()
+        anim_players[i] = player
+
+    background = photo_transfer.widget_rgb(canv_static1)
+    for i, n in enumerate(new_image_paths):
+        anim_service.submit(i, animation.load_animation, os.path.join(image_dir, n), background,
+                            boxes[i] if packing else viewport1,
+                            on_done=lambda anim, i=i: start_animation(i, anim))
+
+    canv_static1.update()
+
+    # print(f'widths: {widths}')
+    # print(f'heights: {heights}')
+    # print(f"reconfig w,h: {canvas_reconfig['w']}, {canvas_reconfig['h']}")
+
+    canv_static1.configure(width=canvas_reconfig['w'], height=canvas_reconfig['h'])
+
+
+
+    """
+    Scale the canvas to hold images with no extra space.
+    This is to handle future situations like:
+      1) all imgs smaller than the viewport width, with no re-scaling
+      2) all imgs smaller than the viewport height, with no re-scaling
+      3) after re-scaling, all img widths or heights smaller than corresponding
+         canvas dimension.
+    In all 3 cases, remove "extra" canvas width or height. The purpose is to allow
+    other objects to be positioned closer to the canvas.
+    """
+    # canvas_config_ht = max(sum(heights[0::2]), sum(heights[1::2])) + viewport['gutter']
+    # print(f'final gutter: {viewport1["gutter"]}')
+    # canvas_reconfig['h'] = max(sum(heights[0::2]) + viewport1['gutter'],
+    #                            sum(heights[1::2]) + viewport1['gutter'])
+    # print(f'canvas_reconfig h: {canvas_reconfig["h"]}')
+    # canvas_reconfig['h'] += (viewport1['gutter'])
+    # print(f'canvas_reconfig h: {canvas_reconfig["h"]}')
+
+    # print()
+    # print(f"static canv reconfig w,h: {canvas_reconfig['w']}, {canvas_reconfig['h']}")
+
+    # canv_static1.configure(width=canvas_reconfig['w'], height=canvas_reconfig['h'])
+
+
+
+    # UI elements ----------
+    ui_fr = ttk.Frame(root, relief='groove')
+
+    if show_layout and not packing:
+        show_vp_borders(canv_static1, viewport1)
+
+    verticals = ['top', 'center', 'bottom']
+    horizontals = ['left', 'center', 'right']
+    vertical_align = tk.StringVar()
+    horizontal_align = tk.StringVar()
+
+    # v_choice = custui.FramedCombo(ui_fr,
+    v_choice = tc.ComboboxFrame(ui_fr,
+                                  cb_values=verticals,
+                                  display_name='vertical',
+                                  name='v_choice',
+                                  var=vertical_align,
+                                  callb=align_images,
+                                  posn=[0,0])
+
+    # h_choice = custui.FramedCombo(ui_fr,
+    h_choice = tc.ComboboxFrame(ui_fr,
+                                  cb_values=horizontals,
+                                  display_name='horizontal',
+                                  name='h_choice',
+                                  var=horizontal_align,
+                                  callb=align_images,
+                                  posn=[0,1])
+
+    ui_fr.pack(side='top', ipadx=10, ipady=10, padx=5, pady=5)
+    ui_fr.update()
+
+    cbvar1 = tk.IntVar(value=0)
+    canv_centered = ttk.Checkbutton(ui_fr,
+                                    text='canvas centered',
+                                    variable=cbvar1,
+                                    name='canvas_centered',
+                                    command=lambda var=cbvar1: align_images_canv_centered(var))
+    canv_centered.grid(row=3, column=0, columnspan=2)
+
+    btnq = ttk.Button(ui_fr,
+                      text="Quit",
+                      command=root.quit,
+                      style="MyButton1.TButton")
+    btnq.grid(row=4, column=0, columnspan=2, pady=10)
+
+    # report some layout dimensions
+    # ------
+    # print(f'canv_static1 h,w: {canv_static1.winfo_height()}, {canv_static1.winfo_width()}')
+    # print(f'ui_fr h,w: {ui_fr.winfo_height()}, {ui_fr.winfo_width()}')
+    # print(f'lab h,w: {lab.winfo_height()}, {lab.winfo_width()}')
+
+    total_ht = lab.winfo_height() + canv_static1.winfo_height() + ui_fr.winfo_height()
+    total_wd = max(lab.winfo_width(), canv_static1.winfo_width(), ui_fr.winfo_width())
+    default_dims = f'{total_wd}x{total_ht}'
+    # print(f'default_dims: {default_dims}')
+    # print(f'    {lab.winfo_height()}, {canv_static1.winfo_height()}, {ui_fr.winfo_height()}')
+
+    # optional: report function signatures.
+    # import inspect
+
+    # print('align_images:')
+    # sig = (inspect.signature(align_images))
+    # print(f'   signature: {sig}')
+
+    root.minsize(total_wd, total_ht)
+    root.mainloop()
+    print(f'image pyramid memory: {image_cache.pyramids_nbytes()} bytes')
+    print(f'render cache: {image_cache.render_cache.stats()}')
+    print(f'disk cache: {thumb_cache.stats()}')
+    for i, exc in loader.failed:
+        print(f'could not load {loader.paths[i]}: {exc}')
+    print(f'placer: {placer1.calls} Tcl calls, {placer1.moved} moved, {placer1.skipped} skipped')
+    print(f'layout: {layout1.recomputed} positions computed')
+    anim_service.shutdown()
+    if anim_players:
+        print(f'animation: {anim_clock.ticks} clock ticks')
+        for i, player in anim_players.items():
+            print(f'  {new_image_paths[i]}: {player.stats()}')
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+"""
+module: image_catalog.py
+
+purpose: Compact, array-backed metadata for large sets of images.
+
+comments: An ImageCatalog keeps one entry per image as columns of NumPy
+          arrays (widths, heights, aspect ratios) rather than one object per
+          image. An image's id is its row number. Paths are stored once, in
+          a list, with a dict from path to id (built on first use), so
+          lookups either way are O(1). Sorting and filtering are vectorized and return id arrays,
+          which index every column at once; take() makes a new catalog
+          from any subset or order of ids.
+          Widths and heights may be native or display sizes, as the caller
+          chooses. render_core.get_positions and order_by_size_new accept a
+          catalog in place of size lists or ImageObjects.
+
+author: Russell Folks
+
+history:
+-------
+10-18-2026  creation: class ImageCatalog.
+"""
+"""
+TODO: -
+"""
+import numpy as np
+from PIL import Image
+
+
+class ImageCatalog:
+    """Paths and sizes of a set of images, stored as columns.
+
+    paths is a sequence of unique paths; widths and heights are sequences
+    of the same length.
+    """
+    def __init__(self,
+                 paths: list,
+                 widths: object,
+                 heights: object):
+        self.paths = list(paths)
+        self.widths = np.asarray(widths, dtype=np.int32)
+        self.heights = np.asarray(heights, dtype=np.int32)
+        if not len(self.paths) == len(self.widths) == len(self.heights):
+            raise ValueError('paths, widths and heights differ in length')
+
+        self.aspects = (self.widths / np.maximum(self.heights, 1)).astype(np.float32)
+        self._ids = None       # path -> id, built on first lookup
+
+    @classmethod
+    def from_sizes(cls, paths: list, sizes: list) -> 'ImageCatalog':
+        """Make a catalog from size dicts with keys 'w' and 'h'.
+
+        image_loader.read_sizes returns such a list.
+        """
+        return cls(paths,
+                   [size['w'] for size in sizes],
+                   [size['h'] for size in sizes])
+
+    @classmethod
+    def from_files(cls, paths: list) -> 'ImageCatalog':
+        """Make a catalog of native image sizes, reading only file headers."""
+        widths = np.empty(len(paths), dtype=np.int32)
+        heights = np.empty(len(paths), dtype=np.int32)
+        for i, path in enumerate(paths):
+            with Image.open(path) as im:
+                widths[i], heights[i] = im.size
+
+        return cls(paths, widths, heights)
+
+    def __len__(self) -> int:
+        return len(self.paths)
+
+    def __repr__(self):
+        cls = self.__class__.__name__
+        return f'{cls}({len(self)} images)'
+
+    def id_of(self, path: str) -> int:
+        return self._id_map()[path]
+
+    def ids_of(self, paths: list) -> np.ndarray:
+        """Ids of several paths, in the order given."""
+        ids = self._id_map()
+
+        return np.fromiter((ids[path] for path in paths),
+                           dtype=np.intp, count=len(paths))
+
+    def ids_by(self,
+               dim: str = 'width',
+               descending: bool = False) -> np.ndarray:
+        """Ids sorted by 'width', 'height' or 'aspect'; ascending, ties in catalog order."""
+        column = {'width': self.widths,
+                  'height': self.heights,
+                  'aspect': self.aspects}[dim]
+        ids = np.argsort(column, kind='stable')
+
+        return ids[::-1] if descending else ids
+
+    def where(self, mask: np.ndarray) -> np.ndarray:
+        """Ids of the images where a boolean mask over the catalog is True.
+
+        For example, catalog.where(catalog.aspects > 1) for landscape images.
+        """
+        return np.flatnonzero(mask)
+
+    def take(self, ids: object) -> 'ImageCatalog':
+        """Return a new catalog of the given ids, in the given order."""
+        ids = np.asarray(ids, dtype=np.intp)
+
+        return ImageCatalog([self.paths[i] for i in ids.tolist()],
+                            self.widths[ids],
+                            self.heights[ids])
+
+    def _id_map(self) -> dict:
+        if self._ids is None:
+            self._ids = {path: i for i, path in enumerate(self.paths)}
+            if len(self._ids) != len(self.paths):
+                raise ValueError('paths are not unique')
+
+        return self._ids
+
+    def nbytes(self) -> int:
+        """Bytes held by the array columns (not the path strings)."""
+        return self.widths.nbytes + self.heights.nbytes + self.aspects.nbytes
@@ -0,0 +1,303 @@
+"""
+module: image_loader.py
+
+purpose: Load and scale sets of images off the Tk thread.
+
+comments: PIL releases the GIL for most of decoding and resizing, so a
+          thread pool scales with the number of cores. Only the conversion
+          to ImageTk.PhotoImage has to happen on the Tk thread, and that is
+          left to the caller.
+          Layout only needs image dimensions. read_sizes() gets them from
+          file headers, so a window can be laid out and shown before any
+          pixels are decoded. DeferredLoader then decodes in the background
+          and hands each image to the Tk thread as it becomes ready.
+          LoadService is the general form: any job runs in a worker thread,
+          and its result comes back through a queue.Queue drained by a
+          widget.after() poll, a few milliseconds of results at a time, so
+          a burst of finished jobs cannot stall the event loop. Jobs have
+          keys; a new job for a key makes the old one stale, so a render for
+          a size that has since changed is cancelled, or discarded if it
+          already ran. Nothing here imports tkinter.
+
+author: Russell Folks
+
+history:
+-------
+10-18-2026  creation: load_scaled(), to decode and scale images to their
+            viewport size concurrently.
+10-18-2026  load_one() decodes at the target size with canvas_ui.open_to_box.
+10-18-2026  load_one() and load_scaled() take an optional
+            image_cache.DiskCache, checked before decoding.
+10-18-2026  Add read_sizes(), a header-only pass for layout, and
+            DeferredLoader, to fill viewports as images are decoded.
+10-18-2026  Use render_core instead of canvas_ui, so loading does not
+            import tkinter.
+10-18-2026  Add class LoadService, with keyed jobs and cancellation of
+            stale ones. DeferredLoader uses it.
+10-18-2026  DeferredLoader counts images that fail to load, and leaves
+            their placeholders, instead of raising on the Tk thread.
+10-18-2026  DeferredLoader takes an optional box per image, for packed
+            layouts where images differ in display size.
+10-18-2026  Move into the image_display_rf package; import sibling
+            modules relatively.
+"""
+"""
+TODO: -
+"""
+import itertools
+import os
+import queue
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from PIL import Image
+
+from . import render_core
+
+
+def read_sizes(paths: list, vp: dict) -> list:
+    """Return the display size of each image, reading only file headers.
+
+    Each result is the dict returned by render_core.init_image_size().
+    """
+    sizes = []
+    for path in paths:
+        with Image.open(path) as im:
+            sizes.append(render_core.init_image_size(im, vp))
+
+    return sizes
+
+
+def load_one(path: str,
+             vp: dict,
+             disk_cache: object = None) -> dict:
+    """Open one image and scale it to fit the viewport.
+
+    If disk_cache (an image_cache.DiskCache) holds a render for path and vp,
+    it is used as is. Otherwise the new render is added to it.
+    """
+    if disk_cache is not None:
+        im = disk_cache.get(path, vp)
+        if im is not None:
+            return {'path': path,
+                    'w': im.width,
+                    'h': im.height,
+                    'im_resize_new': im}
+
+    params = render_core.open_to_box(path, vp)
+    if disk_cache is not None:
+        disk_cache.put(path, vp, params['im_resize_new'])
+
+    return {'path': path,
+            'w': params['im_wd_new'],
+            'h': params['im_ht_new'],
+            'im_resize_new': params['im_resize_new']}
+
+
+def load_scaled(paths: list,
+                vp: dict,
+                workers: int | None = None,
+                disk_cache: object = None) -> list:
+    """Open and scale images concurrently, returning results in input order.
+
+    Each result is the dict returned by load_one(). workers defaults to
+    the number of cores. The disk_cache index is saved when all are done.
+    """
+    workers = workers or os.cpu_count() or 1
+    with ThreadPoolExecutor(max_workers=workers) as ex:
+        results = list(ex.map(load_one, paths,
+                              [vp] * len(paths),
+                              [disk_cache] * len(paths)))
+
+    if disk_cache is not None:
+        disk_cache.save()
+
+    return results
+
+
+class LoadService:
+    """Run jobs in worker threads, and deliver their results on the Tk thread.
+
+    submit() runs fn(*args) in a worker; when it finishes, on_done(result)
+    is called from widget.after(). Only the newest job for a key is
+    delivered: submitting another job for the key, or calling cancel(key),
+    cancels the old job if it has not started, and discards its result if
+    it has. Each poll delivers results for up to budget_ms milliseconds.
+    If a job raises and on_error is None, the exception is re-raised on the
+    Tk thread, as if on_done had raised it.
+    """
+    def __init__(self,
+                 widget: object,
+                 workers: int | None = None,
+                 poll_ms: int = 15,
+                 budget_ms: int = 8):
+        self.widget = widget
+        self.poll_ms = poll_ms
+        self.budget_ms = budget_ms
+
+        self.submitted = 0
+        self.delivered = 0
+        self.cancelled = 0
+        self.stale = 0
+        self.errors = 0
+
+        self._ex = ThreadPoolExecutor(max_workers=workers or os.cpu_count() or 1,
+                                      thread_name_prefix='load')
+        self._results = queue.Queue()    # (key, ticket, future), from workers
+        self._current = {}               # key -> (ticket, future, on_done, on_error)
+        self._tickets = itertools.count()
+        self._job = None
+        self._closed = False
+
+    def submit(self,
+               key: object,
+               fn: callable,
+               *args,
+               on_done: callable,
+               on_error: callable = None) -> int:
+        """Start a job for key, making any earlier job for key stale.
+
+        fn must not touch Tk. Returns the job's ticket number.
+        """
+        self.cancel(key)
+        ticket = next(self._tickets)
+        fut = self._ex.submit(fn, *args)
+        self._current[key] = (ticket, fut, on_done, on_error)
+        fut.add_done_callback(lambda f: self._results.put((key, ticket, f)))
+        self.submitted += 1
+        self._schedule(self.poll_ms)
+
+        return ticket
+
+    def cancel(self, key: object) -> bool:
+        """Make the job for key stale; return False if there was none."""
+        entry = self._current.pop(key, None)
+        if entry is None:
+            return False
+        if entry[1].cancel():
+            self.cancelled += 1
+
+        return True
+
+    def cancel_all(self) -> None:
+        for key in list(self._current):
+            self.cancel(key)
+
+    def is_pending(self, key: object) -> bool:
+        return key in self._current
+
+    def pending_keys(self) -> list:
+        return list(self._current)
+
+    def shutdown(self) -> None:
+        """Cancel all jobs and stop polling; running jobs finish unseen."""
+        self.cancel_all()
+        self._closed = True
+        if self._job is not None:
+            self.widget.after_cancel(self._job)
+            self._job = None
+        self._ex.shutdown(wait=False, cancel_futures=True)
+
+    def stats(self) -> dict:
+        return {'submitted': self.submitted,
+                'delivered': self.delivered,
+                'cancelled': self.cancelled,
+                'stale': self.stale,
+                'errors': self.errors,
+                'pending': len(self._current)}
+
+    def _schedule(self, ms: int) -> None:
+        if self._job is None and not self._closed:
+            self._job = self.widget.after(ms, self._poll)
+
+    def _poll(self) -> None:
+        self._job = None
+        deadline = time.perf_counter() + self.budget_ms / 1000
+        try:
+            while time.perf_counter() < deadline:
+                try:
+                    key, ticket, fut = self._results.get_nowait()
+                except queue.Empty:
+                    break
+                if fut.cancelled():
+                    continue
+                entry = self._current.get(key)
+                if entry is None or entry[0] != ticket:
+                    self.stale += 1
+                    continue
+
+                del self._current[key]
+                _ticket, _fut, on_done, on_error = entry
+                exc = fut.exception()
+                if exc is None:
+                    self.delivered += 1
+                    on_done(fut.result())
+                else:
+                    self.errors += 1
+                    if on_error is None:
+                        raise exc
+                    on_error(exc)
+        finally:
+            if not self._results.empty():
+                self._schedule(1)
+            elif self._current:
+                self._schedule(self.poll_ms)
+
+
+class DeferredLoader:
+    """Decode and scale images in worker threads, delivering them on the Tk thread.
+
+    on_ready(index, result) is called from widget.after() for each image as
+    it finishes, in completion order; result is the dict returned by
+    load_one(). Images that cannot be loaded are skipped, with their index
+    and error kept in failed. The disk_cache index, if any, is saved when
+    all are done, whether or not any failed.
+    The jobs run in a LoadService, keyed by index.
+    Each image is fitted to vp, or to boxes[i] if boxes is given.
+    """
+    def __init__(self,
+                 widget: object,
+                 paths: list,
+                 vp: dict,
+                 on_ready: callable,
+                 disk_cache: object = None,
+                 workers: int | None = None,
+                 poll_ms: int = 20,
+                 boxes: list | None = None):
+        self.widget = widget
+        self.paths = paths
+        self.vp = vp
+        self.boxes = boxes or [vp] * len(paths)
+        self.on_ready = on_ready
+        self.disk_cache = disk_cache
+        self.workers = workers or os.cpu_count() or 1
+        self.poll_ms = poll_ms
+        self.service = None
+        self.failed = []      # (index, exception)
+
+    def start(self) -> None:
+        """Submit all images; results arrive through the service's poll."""
+        self.service = LoadService(self.widget, self.workers, self.poll_ms)
+        for i, path in enumerate(self.paths):
+            self.service.submit(i, load_one, path, self.boxes[i], self.disk_cache,
+                                on_done=lambda result, i=i: self._deliver(i, result),
+                                on_error=lambda exc, i=i: self._fail(i, exc))
+
+    def cancel(self) -> None:
+        """Drop the images not yet delivered."""
+        if self.service is not None:
+            self.service.shutdown()
+
+    def _deliver(self, i: int, result: dict) -> None:
+        self.on_ready(i, result)
+        self._finish_if_done()
+
+    def _fail(self, i: int, exc: Exception) -> None:
+        self.failed.append((i, exc))
+        self._finish_if_done()
+
+    def _finish_if_done(self) -> None:
+        if not self.service.pending_keys():
+            self.service.shutdown()
+            if self.disk_cache is not None:
+                self.disk_cache.save()
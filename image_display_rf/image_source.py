@@ -0,0 +1,183 @@
+"""
+module: image_source.py
+
+purpose: Memory-mapped image sources for large uncompressed files.
+
+comments: Image.open followed by resize reads a whole file into memory.
+          For raw RGB or grayscale dumps, and for uncompressed TIFFs whose
+          strips are stored back to back, RawImageSource maps the file with
+          numpy.memmap instead. Opening costs almost nothing, crop() reads
+          only the rows it covers, and reduce() and resize() read only the
+          strided rows and columns they sample. The OS page cache decides
+          what stays in memory.
+          RawImageSource has the attributes and methods of a PIL image that
+          canvas_ui and image_cache use (width, height, size, mode,
+          filename, getbands, load, crop, reduce, resize), so it can be
+          passed anywhere those modules take an image. Its methods return
+          ordinary PIL images.
+          reduce() samples every factor-th pixel rather than averaging, so
+          it reads 1/factor**2 of the pixels but is more prone to aliasing
+          than Image.reduce.
+          The TIFF header is read without PIL's decompression-bomb check,
+          since nothing is decoded: mapping is how files too large to
+          decode are shown at all. Files that cannot be mapped are opened
+          with Image.open, check included.
+
+author: Russell Folks
+
+history:
+-------
+10-18-2026  creation: RawImageSource, open_raw, open_tiff_strips, open_image.
+10-18-2026  open_tiff_strips reads the header with TiffImageFile, skipping
+            the decompression-bomb check, so very large uncompressed TIFFs
+            are mapped. It returns None for files that are not TIFFs.
+"""
+"""
+TODO: -
+"""
+import numpy as np
+from PIL import Image, TiffImagePlugin
+
+BANDS = {'L': 1, 'RGB': 3, 'RGBA': 4}
+
+
+class RawImageSource:
+    """Pixels of an uncompressed image, memory-mapped from a file.
+
+    Rows start offset bytes into the file and are row_stride bytes apart
+    (default: width * bands, no padding). mode is 'L', 'RGB' or 'RGBA'.
+    """
+    # image_cache.ImagePyramid reduces from the source directly, at any factor.
+    random_access = True
+    format = None
+
+    def __init__(self,
+                 path: str,
+                 width: int,
+                 height: int,
+                 mode: str = 'RGB',
+                 offset: int = 0,
+                 row_stride: int | None = None):
+        if mode not in BANDS:
+            raise ValueError(f'unsupported mode for a raw source: {mode}')
+
+        bands = BANDS[mode]
+        row_bytes = width * bands
+        row_stride = row_stride or row_bytes
+
+        rows = np.memmap(path, dtype=np.uint8, mode='r',
+                         offset=offset, shape=(height, row_stride))
+        self.array = rows[:, :row_bytes].reshape(height, width, bands)
+        self.filename = path
+        self.mode = mode
+        self.info = {}
+
+    @property
+    def width(self) -> int:
+        return self.array.shape[1]
+
+    @property
+    def height(self) -> int:
+        return self.array.shape[0]
+
+    @property
+    def size(self) -> tuple:
+        return (self.width, self.height)
+
+    def __repr__(self):
+        cls = self.__class__.__name__
+        return f'{cls}(path={self.filename!r}, size={self.size}, mode={self.mode!r})'
+
+    def getbands(self) -> tuple:
+        return tuple(self.mode)
+
+    def load(self) -> None:
+        """Nothing to do: pixels are read when they are used."""
+
+    def crop(self, box: tuple) -> Image.Image:
+        """Return the pixels in box (left, upper, right, lower) as a PIL image."""
+        x0, y0, x1, y1 = box
+        return self._to_image(self.array[y0:y1, x0:x1])
+
+    def reduce(self, factor: int) -> Image.Image:
+        """Return every factor-th row and column, as a PIL image."""
+        return self._to_image(self.array[::factor, ::factor])
+
+    def resize(self,
+               size: tuple,
+               resample: int | None = None) -> Image.Image:
+        """Resize, reading only the rows and columns of an integer-step sample.
+
+        The step is the largest that keeps the sample at least as large as
+        size; PIL then resamples from the sample.
+        """
+        step = max(1, min(self.width // size[0], self.height // size[1]))
+
+        return self._to_image(self.array[::step, ::step]).resize(size, resample)
+
+    def to_image(self) -> Image.Image:
+        """Read the whole image into memory."""
+        return self._to_image(self.array)
+
+    def _to_image(self, arr: np.ndarray) -> Image.Image:
+        arr = np.ascontiguousarray(arr)
+        if self.mode == 'L':
+            arr = arr[:, :, 0]
+
+        return Image.fromarray(arr, self.mode)
+
+
+def open_raw(path: str,
+             width: int,
+             height: int,
+             mode: str = 'RGB',
+             offset: int = 0,
+             row_stride: int | None = None) -> RawImageSource:
+    """Map a headerless raw image file."""
+    return RawImageSource(path, width, height, mode, offset, row_stride)
+
+
+def open_tiff_strips(path: str) -> RawImageSource | None:
+    """Map an uncompressed TIFF, if its strips are stored back to back.
+
+    Returns None for TIFFs that are compressed, tiled, or in another mode,
+    and for files that are not TIFFs. Only the header is read, so the
+    image may be larger than Image.MAX_IMAGE_PIXELS.
+    """
+    try:
+        # TiffImageFile, unlike Image.open, does not check the pixel count.
+        with TiffImagePlugin.TiffImageFile(path) as im:
+            if im.mode not in BANDS:
+                return None
+            width, height = im.size
+            mode = im.mode
+            strips = list(im.tile)
+    except (OSError, SyntaxError):
+        return None
+
+    row_bytes = width * BANDS[mode]
+    first_offset = strips[0][2]
+    for strip in strips:
+        codec, extents, offset, args = strip
+        if codec != 'raw' or args[0] != mode or args[1] not in (0, row_bytes):
+            return None
+        if extents[0] != 0 or extents[2] != width:
+            return None
+        if offset != first_offset + extents[1] * row_bytes:
+            return None
+
+    return RawImageSource(path, width, height, mode, first_offset)
+
+
+def open_image(path: str) -> object:
+    """Open an image file, memory-mapped if it is an uncompressed TIFF.
+
+    Other files are opened with Image.open, which raises
+    Image.DecompressionBombError for one too large to decode safely.
+    """
+    if path.lower().endswith(('.tif', '.tiff')):
+        source = open_tiff_strips(path)
+        if source is not None:
+            return source
+
+    return Image.open(path)
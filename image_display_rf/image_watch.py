@@ -0,0 +1,201 @@
+"""
+module: image_watch.py
+
+purpose: Keep an index of the images in a directory, and report changes.
+
+comments: A DirectoryIndex maps each image path to (mtime_ns, size, width,
+          height). scan() lists the directory and compares each file's
+          stat with the index, so image headers are read only for files
+          that are new or changed. It returns the paths added, removed and
+          modified since the last scan.
+          A full scan stats every file. A quick scan relies on the
+          directory's own mtime, which changes when files are added,
+          removed or renamed, but not when a file is rewritten in place: if
+          it is unchanged the scan returns at once, and otherwise only new
+          names are stat'ed. Modified files are found by the next full scan.
+          The index can be saved to a JSON file, so a restart does not read
+          every header again.
+          A DirectoryWatcher scans on a Tk timer and passes changes to a
+          callback, so a canvas can decode and lay out only the images
+          affected. Files that are not readable images are indexed with
+          no size, so they are not read again until they change, and are
+          left out of paths().
+
+author: Russell Folks
+
+history:
+-------
+10-18-2026  creation: DirectoryIndex, DirectoryWatcher.
+10-18-2026  read_dims treats any decode error as an unreadable file, so one
+            bad file cannot stop the watcher. DirectoryWatcher sets its next
+            poll before scanning.
+"""
+"""
+TODO: - Watch subdirectories.
+"""
+import json
+import os
+import stat
+
+from PIL import Image
+
+IMAGE_EXTENSIONS = ('.png', '.jpg', '.jpeg', '.gif', '.bmp', '.tif', '.tiff', '.webp')
+
+
+def read_dims(path: str) -> tuple | None:
+    """Return (width, height) from an image file's header, or None.
+
+    None is returned for files that cannot be opened or decoded, including
+    those PIL rejects as decompression bombs.
+    """
+    try:
+        with Image.open(path) as im:
+            return im.size
+    except (OSError, SyntaxError, ValueError, Image.DecompressionBombError):
+        return None
+
+
+class DirectoryIndex:
+    """Index of the image files in one directory (not subdirectories).
+
+    entries maps path to (mtime_ns, size, width, height); width and height
+    are None for files that could not be read as images. If index_file is
+    given, the index is loaded from it, and save() writes it back.
+    """
+    def __init__(self,
+                 directory: str,
+                 extensions: tuple = IMAGE_EXTENSIONS,
+                 index_file: str | None = None):
+        self.directory = directory
+        self.extensions = tuple(ext.lower() for ext in extensions)
+        self.index_file = index_file
+        self.entries = {}
+        self.dir_mtime = None
+        self.scans = 0
+        self.headers_read = 0
+
+        if index_file and os.path.exists(index_file):
+            try:
+                with open(index_file) as f:
+                    data = json.load(f)
+                self.entries = {path: tuple(entry) for path, entry in data.items()}
+            except (OSError, ValueError):
+                self.entries = {}
+
+    def scan(self, full: bool = True) -> dict:
+        """Update the index from the directory; return what changed.
+
+        The result has lists 'added', 'removed' and 'modified', each sorted.
+        If full is False, files modified in place are not looked for.
+        """
+        self.scans += 1
+        seen = set()
+        added = []
+        modified = []
+
+        dir_mtime = os.stat(self.directory).st_mtime_ns
+        if not full and dir_mtime == self.dir_mtime:
+            return {'added': [], 'removed': [], 'modified': []}
+        self.dir_mtime = dir_mtime
+
+        with os.scandir(self.directory) as it:
+            for entry in it:
+                if not entry.name.lower().endswith(self.extensions):
+                    continue
+                if not full and entry.path in self.entries:
+                    seen.add(entry.path)
+                    continue
+                try:
+                    st = entry.stat()
+                except OSError:
+                    continue
+                if not stat.S_ISREG(st.st_mode):
+                    continue
+
+                path = entry.path
+                seen.add(path)
+                old = self.entries.get(path)
+                if old is not None and old[0] == st.st_mtime_ns and old[1] == st.st_size:
+                    continue
+
+                dims = read_dims(path)
+                self.headers_read += 1
+                self.entries[path] = (st.st_mtime_ns, st.st_size) + (dims or (None, None))
+                if old is None:
+                    added.append(path)
+                else:
+                    modified.append(path)
+
+        removed = [path for path in self.entries if path not in seen]
+        for path in removed:
+            del self.entries[path]
+
+        return {'added': sorted(added),
+                'removed': sorted(removed),
+                'modified': sorted(modified)}
+
+    def paths(self) -> list:
+        """Sorted paths of the indexed files that are readable images."""
+        return sorted(path for path, entry in self.entries.items()
+                      if entry[2] is not None)
+
+    def size_of(self, path: str) -> tuple:
+        """(width, height) of an indexed image."""
+        return self.entries[path][2:]
+
+    def save(self) -> None:
+        """Write the index to index_file, replacing it atomically."""
+        if not self.index_file:
+            return
+
+        os.makedirs(os.path.dirname(self.index_file) or '.', exist_ok=True)
+        tmp = self.index_file + '.tmp'
+        with open(tmp, 'w') as f:
+            json.dump(self.entries, f)
+        os.replace(tmp, self.index_file)
+
+
+def has_changes(changes: dict) -> bool:
+    return bool(changes['added'] or changes['removed'] or changes['modified'])
+
+
+class DirectoryWatcher:
+    """Rescan a DirectoryIndex every poll_ms milliseconds on the Tk thread.
+
+    Every full_every-th scan is a full scan; the others are quick scans.
+    on_change(changes) is called after a scan that found changes, with the
+    dict returned by DirectoryIndex.scan().
+    """
+    def __init__(self,
+                 widget: object,
+                 index: DirectoryIndex,
+                 on_change: callable,
+                 poll_ms: int = 1000,
+                 full_every: int = 10):
+        self.widget = widget
+        self.index = index
+        self.on_change = on_change
+        self.poll_ms = poll_ms
+        self.full_every = full_every
+        self._polls = 0
+        self._job = None
+
+    def start(self) -> None:
+        if self._job is None:
+            self._job = self.widget.after(self.poll_ms, self._poll)
+
+    def stop(self) -> None:
+        if self._job is not None:
+            self.widget.after_cancel(self._job)
+            self._job = None
+
+    def _poll(self) -> None:
+        self._polls += 1
+        # the next poll is set first, so an error below does not stop the watcher.
+        self._job = self.widget.after(self.poll_ms, self._poll)
+        try:
+            changes = self.index.scan(full=self._polls % self.full_every == 0)
+        except OSError:
+            return
+        if has_changes(changes):
+            self.on_change(changes)
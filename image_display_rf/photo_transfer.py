@@ -0,0 +1,170 @@
+"""
+module: photo_transfer.py
+
+purpose: Write PIL images into existing Tk photo images.
+
+comments: ImageTk.PhotoImage makes a new Tk photo image for every frame,
+          and converts the image's mode every time. Here, each source image
+          is converted once to a mode Tk reads directly (RGB or L):
+          palettes are expanded and alpha is flattened over a background
+          color, normally the canvas color. Every render scaled from it is
+          then RGB or L already. Frames are written into one tk.PhotoImage
+          as binary PPM (P6) or PGM (P5) data, with 'image configure
+          -data', so no Tk image is created or deleted per frame, and a
+          canvas item showing the photo follows it without itemconfigure.
+          The photo takes the size of each frame.
+          Random-access sources (image_source.RawImageSource) are not
+          converted as a whole, which would read the whole mapped file;
+          each frame scaled from one is converted as it is written, over
+          the background passed to new_photo or put_image.
+          Conversions are counted, so a caller can check that a source is
+          converted only once. bench_photo_transfer.py compares this path
+          with ImageTk.PhotoImage.
+
+author: Russell Folks
+
+history:
+-------
+10-18-2026  creation: display_source, ppm_data, new_photo, put_image.
+10-18-2026  Add widget_rgb(), the background for flattening alpha.
+10-18-2026  Keep at most MAX_SOURCES converted sources, least recently
+            used dropped first; callers hold the copy they use.
+10-18-2026  display_source leaves random-access sources as they are, and
+            to_display reads them into memory if called directly.
+            new_photo and put_image take the background for frames that
+            are converted one at a time.
+10-18-2026  Move into the image_display_rf package; import sibling
+            modules relatively.
+"""
+"""
+TODO: -
+"""
+import threading
+import tkinter as tk
+from collections import OrderedDict
+
+from PIL import Image
+
+from . import image_cache
+
+# modes written as PPM/PGM data; others are converted first.
+DISPLAY_MODES = ('RGB', 'L')
+GRAY_MODES = ('1', 'L', 'I', 'I;16', 'F')
+
+conversions = {'source': 0, 'frame': 0}
+
+# converted sources kept for sharing; a DynamicImage holds its own copy.
+MAX_SOURCES = 4
+
+_sources = OrderedDict()
+_sources_lock = threading.Lock()
+
+
+def to_display(im: Image.Image,
+               background: tuple = (0, 0, 0)) -> Image.Image:
+    """Convert an image to RGB or L, flattening alpha over background (RGB).
+
+    Images already in RGB or L are returned as they are. A random-access
+    source (image_source.RawImageSource) is read into memory first.
+    """
+    if im.mode in DISPLAY_MODES:
+        return im
+
+    if getattr(im, 'random_access', False):
+        im = im.to_image()
+
+    if im.mode in ('P', 'PA') and ('transparency' in im.info or im.mode == 'PA'):
+        im = im.convert('RGBA')
+    elif im.mode == 'LA':
+        im = im.convert('RGBA')
+    if im.mode in ('RGBA', 'RGBa'):
+        flat = Image.new('RGB', im.size, background)
+        flat.paste(im, mask=im.getchannel('A'))
+        return flat
+
+    if im.mode in GRAY_MODES:
+        return im.convert('L')
+
+    return im.convert('RGB')
+
+
+def widget_rgb(widget: object, color: str | None = None) -> tuple:
+    """8-bit (r, g, b) of a Tk color; the widget's background by default.
+
+    Tk and PIL differ on some color names, such as 'green'.
+    """
+    color = color or widget.cget('background')
+
+    return tuple(c // 257 for c in widget.winfo_rgb(color))
+
+
+def display_source(im: Image.Image,
+                   background: tuple = (0, 0, 0)) -> Image.Image:
+    """Return the display-mode copy of a source image, converting it only once.
+
+    Copies are shared by source (see image_cache.source_key) and
+    background, while they are among the MAX_SOURCES most recently used.
+    Sources in RGB or L, and random-access sources, are returned as they
+    are; frames scaled from the latter are converted one at a time.
+    """
+    if im.mode in DISPLAY_MODES or getattr(im, 'random_access', False):
+        return im
+
+    key = (image_cache.source_key(im), tuple(background))
+    with _sources_lock:
+        converted = _sources.get(key)
+        if converted is None:
+            converted = to_display(im, background)
+            _sources[key] = converted
+            conversions['source'] += 1
+            while len(_sources) > MAX_SOURCES:
+                _sources.popitem(last=False)
+        else:
+            _sources.move_to_end(key)
+
+    return converted
+
+
+def ppm_data(im: Image.Image) -> bytes:
+    """Binary PPM (RGB) or PGM (L) data for an image in a display mode."""
+    magic = b'P5' if im.mode == 'L' else b'P6'
+
+    return b'%s %d %d 255\n' % (magic, im.width, im.height) + im.tobytes()
+
+
+def _frame(im: Image.Image,
+           background: tuple = (0, 0, 0)) -> Image.Image:
+    if im.mode not in DISPLAY_MODES:
+        # the source was not converted by display_source.
+        conversions['frame'] += 1
+        im = to_display(im, background)
+
+    return im
+
+
+def new_photo(im: Image.Image,
+              master: object = None,
+              background: tuple = (0, 0, 0)) -> tk.PhotoImage:
+    """Make a tk.PhotoImage holding an image, to be updated by put_image().
+
+    background is used only if im is not in a display mode.
+    """
+    return tk.PhotoImage(master=master, data=ppm_data(_frame(im, background)), format='PPM')
+
+
+def put_image(photo: tk.PhotoImage,
+              im: Image.Image,
+              background: tuple = (0, 0, 0)) -> None:
+    """Replace the contents of a photo with an image, resizing the photo.
+
+    background is used only if im is not in a display mode.
+    """
+    # tk.call directly: PhotoImage.configure rebuilds its option list per call.
+    photo.tk.call(photo.name, 'configure',
+                  '-format', 'PPM', '-data', ppm_data(_frame(im, background)))
+
+
+def stats() -> dict:
+    """Counts of source conversions, and of frames converted one at a time."""
+    with _sources_lock:
+        return dict(conversions, sources=len(_sources))
@@ -0,0 +1,48 @@
+"""
+module: project_paths.py
+
+purpose: Locate the project directory, and the data the programs use.
+
+comments: The programs were run from the project directory, and opened
+          'images/...' and '.thumbcache' relative to the working directory.
+          Installed as commands, they may be started from anywhere, so data
+          paths are resolved here instead: from a command-line argument if
+          one is given, or else from the project directory, the one holding
+          this package.
+          The disk cache goes beside the images directory, so the default
+          is the project's own .thumbcache, as before.
+
+author: Russell Folks
+
+history:
+-------
+10-18-2026  creation: PROJECT_DIR, images_dir, cache_dir, add_arguments.
+"""
+"""
+TODO: -
+"""
+import os
+
+PROJECT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def images_dir(path: str | None = None) -> str:
+    """The images directory: path if given, else images/ in the project."""
+    return os.path.abspath(path or os.path.join(PROJECT_DIR, 'images'))
+
+
+def cache_dir(image_dir: str,
+              path: str | None = None) -> str:
+    """The disk cache directory: path if given, else .thumbcache beside image_dir."""
+    if path:
+        return os.path.abspath(path)
+
+    return os.path.join(os.path.dirname(os.path.abspath(image_dir)), '.thumbcache')
+
+
+def add_arguments(parser: object) -> None:
+    """Add the --images and --cache-dir options to an ArgumentParser."""
+    parser.add_argument('--images', default=None,
+                        help='directory of the images shown (default: images/ in the project)')
+    parser.add_argument('--cache-dir', default=None,
+                        help='disk cache directory (default: .thumbcache beside the images)')
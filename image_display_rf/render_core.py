@@ -0,0 +1,351 @@
+"""
+module: render_core.py
+
+purpose: Image layout, scaling and compositing, with no dependence on Tk.
+
+comments: The viewport model: a canvas is divided into rows x cols
+          viewports of vp['w'] x vp['h'], separated by vp['gutter']. Each
+          image is scaled to fit its viewport, and aligned within it, or
+          toward the center of the whole grid with ('cc', 'cc').
+          These functions were part of canvas_ui.py, which still exports
+          them, so the Tk viewers and headless batch code share one layout.
+          render_layout() composes a layout into a single PIL image,
+          optionally with the viewport borders drawn by the static canvas.
+          Nothing here imports tkinter, so it runs on servers without a
+          display and in worker processes.
+
+author: Russell Folks
+
+history:
+-------
+10-18-2026  creation: compare_ratios, scale_image, open_to_box, Posn,
+            get_positions, get_1_posn, set_canv_centered and
+            init_image_size moved from canvas_ui.py. Remove the debug print
+            from compare_ratios. Add composite, draw_vp_borders and
+            render_layout.
+10-18-2026  Add ImageObject and order_by_size_new, moved from
+            image_canvas_static.py.
+10-18-2026  get_positions and order_by_size_new accept an
+            image_catalog.ImageCatalog. ImageObject uses __slots__.
+10-18-2026  Move into the image_display_rf package; import sibling
+            modules relatively.
+"""
+"""
+TODO: -
+"""
+from PIL import Image, ImageDraw
+
+from . import grid_layout
+from . import image_cache
+from . import image_source
+
+# -------
+# utility
+# -------
+def compare_ratios(vp: float,
+                   im: float,
+                   w: int,
+                   h: int) -> dict:
+    """Set new image height and/or width based on viewport shape.
+
+    Images will be scaled up or down to match viewport height or width.
+    """
+    if vp > im:
+        ht_new = h
+        wid_new = int(ht_new * im)
+    else:
+        wid_new = w
+        ht_new = int(wid_new / im)
+
+    return {"h":ht_new, "w": wid_new}
+
+
+def scale_image(im: Image.Image,
+                w: int,
+                h: int,
+                resample: int | None = None,
+                cache: bool = True) -> Image.Image:
+    """Resize an image, starting from the smallest pyramid level that covers w, h.
+
+    resample is a PIL filter; None uses the PIL default for Image.resize.
+    If cache is True, renders are looked up in and added to
+    image_cache.render_cache.
+    """
+    if cache:
+        key = image_cache.render_key(im, w, h, resample)
+        im_new = image_cache.render_cache.get(key)
+        if im_new is not None:
+            return im_new
+
+    src = image_cache.get_pyramid(im).level_for(w, h)
+    im_new = src.resize((w, h), resample)
+
+    if cache:
+        image_cache.render_cache.put(key, im_new)
+
+    return im_new
+
+
+def open_to_box(path: str,
+                box: dict,
+                resample: int | None = None,
+                cache: bool = True) -> dict:
+    """Open an image file and scale it to fit a box, decoding no more than needed.
+
+    box is a dict with keys 'w' and 'h', such as a viewport. Only the file
+    header is read to find the display size. JPEG files are then decoded
+    at the nearest power-of-two scale above that size with Image.draft.
+    Other formats are decoded in full, then reduced by the largest power of
+    two that stays above the display size, before the final resample.
+    Uncompressed TIFFs are memory-mapped (image_source.open_image), and
+    reduced by reading only the rows and columns sampled.
+    Renders are shared with scale_image() through image_cache.render_cache.
+    """
+    im = image_source.open_image(path)
+    native_w, native_h = im.size
+
+    newsize = compare_ratios(box['w'] / box['h'], native_w / native_h,
+                             box['w'], box['h'])
+    w, h = newsize['w'], newsize['h']
+
+    key = image_cache.source_key(im) + (w, h, resample)
+    im_new = image_cache.render_cache.get(key) if cache else None
+
+    if im_new is None:
+        if im.format == 'JPEG':
+            im.draft(im.mode, (w, h))
+        else:
+            factor = 1
+            while native_w // (factor * 2) >= w and native_h // (factor * 2) >= h:
+                factor *= 2
+            if factor > 1:
+                im = image_cache.reduce_image(im, factor)
+
+        im_new = im.resize((w, h), resample)
+        if cache:
+            image_cache.render_cache.put(key, im_new)
+
+    return {'im_resize_new': im_new,
+            'im_wd_new': w,
+            'im_ht_new': h,
+            'native_wd': native_w,
+            'native_ht': native_h,
+            'key': key}
+
+
+# ------
+# layout
+# ------
+def posn_init(self, x: int, y: int):
+    self.x = x
+    self.y = y
+
+Posn = type('Posn', (), {"__init__": posn_init})
+
+
+def get_positions(vp: dict,
+                  wd: object,
+                  ht: list | None,
+                  arrange: tuple,
+                  cols: int = 2,
+                  rows: int | None = None) -> list:
+    """Assign locations for all images in a Canvas.
+
+    Images fill a grid of viewports with cols columns, in row order.
+    rows defaults to 2, or more if needed to hold all images.
+    wd may be an image_catalog.ImageCatalog, with ht None; its widths and
+    heights are used, in catalog order.
+    """
+    if ht is None:
+        wd, ht = wd.widths, wd.heights
+    if rows is None:
+        rows = max(2, grid_layout.grid_shape(len(wd), cols)[0])
+
+    xs, ys = grid_layout.grid_positions(vp, wd, ht, arrange, cols, rows)
+
+    return [Posn(x, y) for x, y in zip(xs.tolist(), ys.tolist())]
+
+
+def get_1_posn(vp: dict,
+               wd: list,
+               ht: list,
+               arrange: tuple,
+               shift_right: bool = False,
+               shift_down: bool = False) -> Posn:
+    """Assign location for one image in a Canvas."""
+    imp = Posn(0, 0)
+
+    match arrange[1]:
+        case 'top':
+            imp.y = 0
+        case 'center':
+            imp.y = (vp['h'] - ht) / 2
+        case 'bottom':
+            imp.y = vp['h'] - ht
+
+    match arrange[0]:
+        case 'left':
+            imp.x = 0
+        case 'center':
+            imp.x = (vp['w'] - wd) / 2
+        case 'right':
+            imp.x = vp['w'] - wd
+
+    # if shift_right is True:
+    if shift_right:
+        imp.x += (vp['w'] + vp['gutter'])
+    # if shift_down is True:
+    if shift_down:
+        imp.y += (vp['h'] + vp['gutter'])
+
+    return imp
+
+
+def set_canv_centered(vp: dict,
+                      wd: list,
+                      ht: list) -> list:
+    """Assign locations that move images toward the center of a 2x2 canvas."""
+    return get_positions(vp, wd, ht, ('cc', 'cc'))
+
+
+def init_image_size(im: object,
+                    vp: dict) -> dict:
+    """Set image display size and shape, based on the defined viewport size."""
+    vp_ratio = vp['w'] / vp['h']
+    im_ratio = im.width / im.height
+
+    newsize = compare_ratios(vp_ratio, im_ratio, vp['w'], vp['h'])
+
+    return newsize
+
+
+# --------
+# ordering
+# --------
+class ImageObject():
+    __slots__ = ('path', 'width', 'height')
+
+    def __init__(self,
+                 path='',
+                 width=0,
+                 height=0):
+        self.path = path
+        self.width = width
+        self.height = height
+
+    def __repr__(self):
+        cls = self.__class__.__name__
+        return f'{cls}(path={self.path}, width={self.width!r}, height={self.height!r})'
+
+
+def order_by_size_new(objects, dim='width') -> list:
+    """Find the images of greatest dimension.
+
+    argument dims specifies the dimension, as image widths or heights.
+    If heights are passed, the display arrangement is given by diagram (1),
+    if widths are passed, the display arrangement is given by diagram (2).
+    (1)                            (2)
+    tallest-----x                  widest-----x
+       |         |           OR:     |        |
+       x----next_tallest             x----next_widest
+
+    This function should only be called if len(dims) > 2. For 1 or 2
+    images, this function does not manage display arrangement.
+    objects is a list of ImageObject, sorted in place, or an
+    image_catalog.ImageCatalog, which is not changed.
+    """
+    num_items = len(objects)
+
+    if hasattr(objects, 'ids_by'):
+        # a catalog: sort ids, not objects
+        paths = [objects.paths[i] for i in objects.ids_by(dim).tolist()]
+    else:
+        if dim == 'width':
+            objects.sort(key=lambda x: x.width)
+        else:
+            objects.sort(key=lambda x: x.height)
+        paths = [obj.path for obj in objects]
+
+    # interleave the larger and smaller dim
+    if num_items == 4:
+        newpaths = [paths[3], paths[1], paths[0], paths[2]]
+    else:
+        if num_items == 3:
+            newpaths = [paths[2], paths[0], paths[1]]
+        else:
+            newpaths = [paths[1], paths[0]]
+
+    return newpaths
+
+
+# ---------
+# rendering
+# ---------
+def composite(images: list,
+              positions: list,
+              size: dict,
+              background: str = 'green',
+              mode: str = 'RGB') -> Image.Image:
+    """Paste scaled images at their positions on a new image.
+
+    positions are Posn, as returned by get_positions. size is a dict with
+    keys 'w' and 'h'. Images with transparency are pasted through their
+    alpha band.
+    """
+    sheet = Image.new(mode, (size['w'], size['h']), background)
+    for im, posn in zip(images, positions):
+        xy = (round(posn.x), round(posn.y))
+        if 'A' in im.getbands() or 'transparency' in im.info:
+            im = im.convert('RGBA')
+            sheet.paste(im, xy, im)
+        else:
+            sheet.paste(im, xy)
+
+    return sheet
+
+
+def draw_vp_borders(sheet: Image.Image,
+                    vp: dict,
+                    rows: int = 2,
+                    cols: int = 2,
+                    color: str = 'black') -> Image.Image:
+    """Outline each viewport, as the static canvas does."""
+    draw = ImageDraw.Draw(sheet)
+    for rect in grid_layout.vp_rects(vp, rows, cols).tolist():
+        draw.rectangle(rect, outline=color)
+
+    return sheet
+
+
+def render_layout(paths: list,
+                  vp: dict,
+                  arrange: tuple = ('left', 'top'),
+                  cols: int = 2,
+                  rows: int | None = None,
+                  show_borders: bool = False,
+                  background: str = 'green',
+                  resample: int | None = None,
+                  cache: bool = False) -> Image.Image:
+    """Compose image files into one image, laid out as on the static canvas.
+
+    Each file is decoded near its display size with open_to_box, and placed
+    with get_positions; rows defaults as there. The result is the size of
+    the full grid of viewports. cache is passed to open_to_box; it is off by
+    default, so batch runs do not fill image_cache.render_cache.
+    """
+    if rows is None:
+        rows = max(2, grid_layout.grid_shape(len(paths), cols)[0])
+
+    scaled = [open_to_box(path, vp, resample, cache) for path in paths]
+    wd = [params['im_wd_new'] for params in scaled]
+    ht = [params['im_ht_new'] for params in scaled]
+    positions = get_positions(vp, wd, ht, arrange, cols, rows)
+
+    sheet = composite([params['im_resize_new'] for params in scaled],
+                      positions,
+                      grid_layout.canvas_size(vp, rows, cols),
+                      background)
+    if show_borders:
+        draw_vp_borders(sheet, vp, rows, cols)
+
+    return sheet
@@ -0,0 +1,45 @@
+"""
+module: sibling_modules.py
+
+purpose: Import modules shared with sibling projects.
+
+comments: styles_ttk and tool_classes are not part of this project. They
+          live in sibling project directories (../styles, ../utilities),
+          and were loaded with SourceFileLoader from paths relative to the
+          working directory. import_sibling imports them as normal modules
+          instead: from the installed environment if they are there, or
+          else from the sibling directory next to this project, wherever
+          the program is run from. The project directory is the one that
+          holds the image_display_rf package (project_paths.PROJECT_DIR).
+
+author: Russell Folks
+
+history:
+-------
+10-18-2026  creation: import_sibling.
+10-18-2026  Move into the image_display_rf package; take the project
+            directory from project_paths.
+"""
+"""
+TODO: -
+"""
+import importlib
+import os
+import sys
+
+from .project_paths import PROJECT_DIR
+
+
+def import_sibling(name: str, subdir: str) -> object:
+    """Import module name, looking in ../subdir if it is not installed."""
+    try:
+        return importlib.import_module(name)
+    except ModuleNotFoundError as e:
+        if e.name != name:
+            raise
+
+    path = os.path.normpath(os.path.join(PROJECT_DIR, '..', subdir))
+    if path not in sys.path:
+        sys.path.append(path)
+
+    return importlib.import_module(name)
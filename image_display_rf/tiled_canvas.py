@@ -0,0 +1,197 @@
+"""
+module: tiled_canvas.py
+
+purpose: Tile-based display of very large images in a dynamic canvas.
+
+comments: Instead of resizing the whole image to the canvas, the image is
+          drawn as fixed-size tiles cut from the pyramid level nearest the
+          display scale (image_cache.ImagePyramid). Only tiles that
+          intersect the visible part of the canvas are cropped, scaled and
+          given a PhotoImage and a canvas item. Scaled tiles are kept in a
+          bounded LRU cache, and canvas items are pooled, so the memory held
+          for display depends on the screen area, not on the image size.
+          The image starts fitted to the canvas. The mouse wheel zooms about
+          the pointer, dragging pans, and a double click fits it again.
+
+author: Russell Folks
+
+history:
+-------
+10-18-2026  creation: class TiledImage.
+10-18-2026  Import PIL.ImageTk when a tile is first shown.
+10-18-2026  Move into the image_display_rf package; import sibling
+            modules relatively.
+"""
+"""
+TODO: -
+"""
+import tkinter as tk
+
+from PIL import Image
+
+from . import canvas_ui as cnv_ui
+from . import image_cache
+
+
+class TiledImage:
+    """A large image drawn on a canvas as tiles of the nearest pyramid level.
+
+    resize(ev) is the <Configure> handler, for use with
+    canvas_ui.ResizeScheduler. max_bytes caps the cache of scaled tiles.
+    """
+    def __init__(self,
+                 canv: tk.Canvas,
+                 im: Image.Image,
+                 tile_size: int = 256,
+                 max_bytes: int = 32 * 2**20,
+                 resample: int = Image.Resampling.BICUBIC,
+                 zoom_step: float = 1.25,
+                 max_scale: float = 4.0):
+        self.canv = canv
+        self.pyr = image_cache.get_pyramid(im)
+        self.src_w, self.src_h = im.size
+        self.tile_size = tile_size
+        self.resample = resample
+        self.zoom_step = zoom_step
+        self.max_scale = max_scale
+
+        self.scale = 1.0       # display pixels per source pixel
+        self.fit = True
+        self.tile_cache = image_cache.RenderCache(max_bytes)
+
+        self._items = {}       # tile key -> canvas item id
+        self._photos = {}      # tile key -> PhotoImage
+        self._free_items = []
+        self._render_job = None
+
+        canv.bind('<ButtonPress-1>', lambda ev: canv.scan_mark(ev.x, ev.y))
+        canv.bind('<B1-Motion>', self._on_drag)
+        canv.bind('<Double-Button-1>', self._on_fit)
+        for seq in ('<MouseWheel>', '<Button-4>', '<Button-5>'):
+            canv.bind(seq, self._on_wheel)
+
+    @property
+    def item_count(self) -> int:
+        """Number of image items on the canvas, in use or pooled."""
+        return len(self._items) + len(self._free_items)
+
+    def display_size(self) -> tuple:
+        return (max(1, round(self.src_w * self.scale)),
+                max(1, round(self.src_h * self.scale)))
+
+    def resize(self, ev: tk.Event) -> None:
+        """Refit the image to a resized canvas, if fitted, and redraw."""
+        if self.fit:
+            self.fit_to(ev.width, ev.height)
+        self.render()
+
+    def fit_to(self, width: int, height: int) -> None:
+        """Set the scale that fits the whole image in width, height."""
+        newsize = cnv_ui.compare_ratios(width / height,
+                                        self.src_w / self.src_h,
+                                        width, height)
+        self.scale = newsize['w'] / self.src_w
+        self._set_scrollregion()
+
+    def zoom(self, factor: float, x: int, y: int) -> None:
+        """Scale the display by factor, keeping canvas window point x, y fixed."""
+        min_scale = min(1.0, self.canv.winfo_width() / self.src_w,
+                        self.canv.winfo_height() / self.src_h)
+        new_scale = min(self.max_scale, max(min_scale, self.scale * factor))
+        factor = new_scale / self.scale
+        if factor == 1.0:
+            return
+
+        cx = self.canv.canvasx(x) * factor
+        cy = self.canv.canvasy(y) * factor
+        self.fit = False
+        self.scale = new_scale
+        disp_w, disp_h = self._set_scrollregion()
+        self.canv.xview_moveto((cx - x) / disp_w)
+        self.canv.yview_moveto((cy - y) / disp_h)
+        self.schedule_render()
+
+    def schedule_render(self) -> None:
+        if self._render_job is None:
+            self._render_job = self.canv.after_idle(self.render)
+
+    def render(self) -> None:
+        """Draw the tiles that intersect the visible region; release the rest."""
+        self._render_job = None
+        disp_w, disp_h = self.display_size()
+        n = self.pyr.level_index(disp_w, disp_h)
+        level = self.pyr.levels[n]
+        level_scale = disp_w / level.width
+        span = self.tile_size * level_scale     # tile size on the canvas
+
+        x0 = max(0.0, self.canv.canvasx(0))
+        y0 = max(0.0, self.canv.canvasy(0))
+        x1 = min(disp_w, self.canv.canvasx(self.canv.winfo_width()))
+        y1 = min(disp_h, self.canv.canvasy(self.canv.winfo_height()))
+
+        wanted = set()
+        if x1 > x0 and y1 > y0:
+            for ty in range(int(y0 // span), int((y1 - 1) // span) + 1):
+                for tx in range(int(x0 // span), int((x1 - 1) // span) + 1):
+                    wanted.add((n, disp_w, tx, ty))
+
+        for key in [k for k in self._items if k not in wanted]:
+            item = self._items.pop(key)
+            self.canv.itemconfigure(item, image='', state='hidden')
+            self._free_items.append(item)
+            self._photos.pop(key, None)
+
+        for key in wanted:
+            if key not in self._items:
+                self._show_tile(key, level, level_scale)
+
+    def _show_tile(self, key: tuple, level: Image.Image, level_scale: float) -> None:
+        from PIL import ImageTk
+
+        _n, _disp_w, tx, ty = key
+        size = self.tile_size
+        box = (tx * size, ty * size,
+               min(level.width, (tx + 1) * size), min(level.height, (ty + 1) * size))
+        # round the tile's edges, not its size, so neighbors meet exactly.
+        dest = [round(c * level_scale) for c in box]
+        dest_w, dest_h = max(1, dest[2] - dest[0]), max(1, dest[3] - dest[1])
+
+        cache_key = self.pyr.key + key + (dest_w, dest_h)
+        tile = self.tile_cache.get(cache_key)
+        if tile is None:
+            tile = level.crop(box).resize((dest_w, dest_h), self.resample)
+            self.tile_cache.put(cache_key, tile)
+
+        photo = ImageTk.PhotoImage(tile)
+        if self._free_items:
+            item = self._free_items.pop()
+            self.canv.coords(item, dest[0], dest[1])
+            self.canv.itemconfigure(item, image=photo, state='normal')
+        else:
+            item = self.canv.create_image(dest[0], dest[1], anchor=tk.NW, image=photo)
+
+        self._items[key] = item
+        self._photos[key] = photo
+
+    def _set_scrollregion(self) -> tuple:
+        disp_w, disp_h = self.display_size()
+        self.canv.configure(scrollregion=(0, 0, disp_w, disp_h))
+
+        return disp_w, disp_h
+
+    def _on_drag(self, ev: tk.Event) -> None:
+        self.canv.scan_dragto(ev.x, ev.y, gain=1)
+        self.schedule_render()
+
+    def _on_fit(self, ev: tk.Event) -> None:
+        self.fit = True
+        self.fit_to(self.canv.winfo_width(), self.canv.winfo_height())
+        self.canv.xview_moveto(0)
+        self.canv.yview_moveto(0)
+        self.render()
+
+    def _on_wheel(self, ev: tk.Event) -> None:
+        if ev.num == 4 or ev.delta > 0:
+            self.zoom(self.zoom_step, ev.x, ev.y)
+        else:
+            self.zoom(1 / self.zoom_step, ev.x, ev.y)